@@ -1,6 +1,7 @@
 """
 NASDAQ Stock Agent - Main Application Entry Point
 """
+import importlib.util
 import logging
 import uvicorn
 from src.api.app import create_app
@@ -71,6 +72,9 @@ if __name__ == "__main__":
         
         logger.info(f"Starting server on {host}:{port} (debug={debug})")
         
+        # uvloop is an optional dependency (not available on Windows); fall back to the stdlib loop
+        event_loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+        
         # Run server
         uvicorn.run(
             "main:main",
@@ -78,6 +82,7 @@ if __name__ == "__main__":
             port=port,
             reload=debug,
             factory=True,
+            loop=event_loop,
             log_level="info" if not debug else "debug"
         )
         
@@ -7,10 +7,6 @@ import asyncio
 import logging
 import sys
 import signal
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from src.mcp.mcp_server import mcp_server
 from src.core.config_manager import config_manager
@@ -24,6 +20,13 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Skip per-record thread/process/task introspection; the formatter never prints it
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+if hasattr(logging, 'logAsyncioTasks'):
+    logging.logAsyncioTasks = False
+
 
 class MCPServerRunner:
     """Standalone MCP server runner"""
@@ -113,6 +116,10 @@ class MCPServerRunner:
 
 async def main():
     """Main entry point for standalone MCP server"""
+    # Run tool-call coroutines eagerly until their first real suspension (Python 3.12+)
+    if hasattr(asyncio, 'eager_task_factory'):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     runner = MCPServerRunner()
     
     try:
@@ -125,6 +132,13 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Prefer the libuv-backed event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
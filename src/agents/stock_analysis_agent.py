@@ -5,6 +5,7 @@ import asyncio
 from typing import Dict, Any, Optional, List
 import json
 import logging
+import time
 from datetime import datetime
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain_anthropic import ChatAnthropic
@@ -116,14 +117,14 @@ Thought: I need to analyze this stock query step by step.
     
     async def analyze_stock_query(self, query: str, session_id: str = None) -> Dict[str, Any]:
         """Analyze a stock query using direct tool execution (bypassing LangChain agent for reliability)"""
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Use direct tool execution instead of LangChain agent for better reliability
             result = await self._execute_direct_analysis(query)
             
             # Calculate processing time
-            processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             # Add processing time to result
             result['processing_time_ms'] = processing_time
@@ -137,7 +138,7 @@ Thought: I need to analyze this stock query step by step.
             return result
             
         except Exception as e:
-            processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
             logger.error(f"Stock analysis failed for query '{query}': {e}", exc_info=True)
             
             return {
@@ -3,17 +3,19 @@ FastAPI application factory and configuration
 """
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from src.api.responses import OrjsonResponse, utc_now_iso
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 import os
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from typing import Optional, Set
 from src.config.settings import settings
 from src.api.routers import analysis, health, agent
 from src.services.logging_middleware import RequestLoggingMiddleware, monitoring_service
 from src.services.cache_service import global_cache
+from src.services.logging_service import logging_service
+from src.services.market_data_service import market_data_service
 from src.api.middleware.validation import ValidationMiddleware
 from src.api.error_handlers import setup_error_handlers
 
@@ -96,6 +98,20 @@ def get_nest_adapter():
     return _nest_adapter
 
 
+# Startup tasks that run in the background, kept referenced until they finish
+_background_tasks: Set[asyncio.Task] = set()
+
+
+async def _warm_up_market_data() -> None:
+    """Warm up market data connections, logging rather than raising on failure"""
+    try:
+        await market_data_service.warm_up()
+    except Exception as e:
+        logger.warning(f"Market data warm-up failed: {e}")
+    finally:
+        _background_tasks.discard(asyncio.current_task())
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
@@ -117,6 +133,10 @@ async def lifespan(app: FastAPI):
         # Initialize monitoring
         await monitoring_service.initialize_monitoring()
         
+        # Warm the Yahoo Finance session in the background; startup does not wait on the network
+        if settings.yfinance_warmup_on_startup:
+            _background_tasks.add(asyncio.create_task(_warm_up_market_data()))
+        
         # Initialize NEST integration
         try:
             await initialize_nest()
@@ -136,6 +156,10 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down NASDAQ Stock Agent...")
     
     try:
+        # Stop startup tasks that are still running
+        for task in list(_background_tasks):
+            task.cancel()
+        
         # Shutdown NEST integration
         try:
             await shutdown_nest()
@@ -148,6 +172,12 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"Failed to shutdown global cache cleanly: {e}")
         
+        # Write any buffered analysis and error log entries
+        try:
+            await logging_service.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush log entries: {e}")
+        
         logger.info("NASDAQ Stock Agent shut down successfully")
         
     except Exception as e:
@@ -190,6 +220,7 @@ def create_app() -> FastAPI:
         """,
         debug=settings.debug,
         lifespan=lifespan,
+        default_response_class=OrjsonResponse,
         docs_url="/docs",
         redoc_url="/redoc"
     )
@@ -221,32 +252,33 @@ def create_app() -> FastAPI:
         """Global exception handler for unhandled errors"""
         logger.error(f"Unhandled exception in {request.method} {request.url}: {exc}")
         
-        return JSONResponse(
+        return OrjsonResponse(
             status_code=500,
             content={
                 "error_code": "INTERNAL_SERVER_ERROR",
                 "error_message": "An internal server error occurred",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utc_now_iso(),
                 "path": str(request.url.path)
             }
         )
     
-    # Root endpoint
+    # Root endpoint; everything but the timestamp is fixed for the app's lifetime
+    root_info = {
+        "service": settings.app_name,
+        "version": settings.app_version,
+        "description": "AI-powered NASDAQ stock analysis and investment recommendations",
+        "documentation": "/docs",
+        "health_check": "/health",
+        "api_endpoints": {
+            "analyze_stock": "/api/v1/analyze",
+            "agent_info": "/api/v1/agent/info",
+            "system_status": "/status"
+        }
+    }
+    
     @app.get("/")
     async def root():
         """Root endpoint with API information"""
-        return {
-            "service": settings.app_name,
-            "version": settings.app_version,
-            "description": "AI-powered NASDAQ stock analysis and investment recommendations",
-            "documentation": "/docs",
-            "health_check": "/health",
-            "api_endpoints": {
-                "analyze_stock": "/api/v1/analyze",
-                "agent_info": "/api/v1/agent/info",
-                "system_status": "/status"
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        return OrjsonResponse({**root_info, "timestamp": utc_now_iso()})
     
     return app
\ No newline at end of file
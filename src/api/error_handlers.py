@@ -2,11 +2,10 @@
 Comprehensive error handling for NASDAQ Stock Agent API
 """
 from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from src.api.responses import OrjsonResponse, utc_now_iso
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 import logging
-from datetime import datetime
 from typing import Dict, Any, Union
 from src.api.middleware.validation import create_validation_error_response, create_custom_error_response
 from src.services.logging_service import logging_service
@@ -18,7 +17,7 @@ class APIErrorHandler:
     """Centralized API error handling"""
     
     @staticmethod
-    async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+    async def validation_exception_handler(request: Request, exc: RequestValidationError) -> OrjsonResponse:
         """Handle Pydantic validation errors"""
         logger.warning(f"Validation error in {request.method} {request.url}: {exc}")
         
@@ -36,15 +35,15 @@ class APIErrorHandler:
         # Create detailed validation error response
         error_response = create_validation_error_response(exc)
         
-        return JSONResponse(
+        return OrjsonResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content=error_response
         )
     
     @staticmethod
-    async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+    async def http_exception_handler(request: Request, exc: HTTPException) -> OrjsonResponse:
         """Handle HTTP exceptions"""
-        logger.warning(f"HTTP exception in {request.method} {request.url}: {exc.status_code} - {exc.detail}")
+        logger.warning("HTTP exception in %s %s: %s - %s", request.method, request.url, exc.status_code, exc.detail)
         
         # Log HTTP error if it's a server error
         if exc.status_code >= 500:
@@ -65,16 +64,16 @@ class APIErrorHandler:
             detail = {
                 "error_code": f"HTTP_{exc.status_code}",
                 "error_message": str(exc.detail),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             }
         
-        return JSONResponse(
+        return OrjsonResponse(
             status_code=exc.status_code,
             content=detail
         )
     
     @staticmethod
-    async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def general_exception_handler(request: Request, exc: Exception) -> OrjsonResponse:
         """Handle general unhandled exceptions"""
         logger.error(f"Unhandled exception in {request.method} {request.url}: {exc}", exc_info=True)
         
@@ -99,13 +98,13 @@ class APIErrorHandler:
             }
         )
         
-        return JSONResponse(
+        return OrjsonResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content=error_response
         )
     
     @staticmethod
-    async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
+    async def value_error_handler(request: Request, exc: ValueError) -> OrjsonResponse:
         """Handle ValueError exceptions"""
         logger.warning(f"Value error in {request.method} {request.url}: {exc}")
         
@@ -131,13 +130,13 @@ class APIErrorHandler:
             }
         )
         
-        return JSONResponse(
+        return OrjsonResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content=error_response
         )
     
     @staticmethod
-    async def timeout_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def timeout_error_handler(request: Request, exc: Exception) -> OrjsonResponse:
         """Handle timeout errors"""
         logger.error(f"Timeout error in {request.method} {request.url}: {exc}")
         
@@ -163,7 +162,7 @@ class APIErrorHandler:
             }
         )
         
-        return JSONResponse(
+        return OrjsonResponse(
             status_code=status.HTTP_408_REQUEST_TIMEOUT,
             content=error_response
         )
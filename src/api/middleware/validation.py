@@ -2,21 +2,34 @@
 Request validation middleware and utilities for NASDAQ Stock Agent
 """
 import re
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable
 from fastapi import HTTPException, Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 from pydantic import BaseModel, validator, ValidationError
 import logging
 from datetime import datetime
+from src.api.responses import utc_now_iso
 
 logger = logging.getLogger(__name__)
 
+# Fixed, body-less endpoints (probes and static info) that cannot fail path or size validation
+DEFAULT_SKIP_VALIDATION_PATHS = frozenset({
+    "/",
+    "/health",
+    "/status",
+    "/metrics",
+    "/api/v1/agent/info",
+    "/api/v1/agent/capabilities",
+    "/api/v1/agent/registry",
+    "/api/v1/agent/examples"
+})
+
 
 class ValidationMiddleware(BaseHTTPMiddleware):
     """Middleware for request validation and sanitization"""
     
-    def __init__(self, app: ASGIApp):
+    def __init__(self, app: ASGIApp, skip_paths: Optional[Iterable[str]] = None):
         super().__init__(app)
         self.max_request_size = 10 * 1024 * 1024  # 10MB
         self.blocked_patterns = [
@@ -26,9 +39,14 @@ class ValidationMiddleware(BaseHTTPMiddleware):
             r'eval\s*\(',
             r'expression\s*\('
         ]
+        self._blocked_path_regex = re.compile('|'.join(self.blocked_patterns), re.IGNORECASE)
+        self.skip_paths = frozenset(skip_paths) if skip_paths is not None else DEFAULT_SKIP_VALIDATION_PATHS
     
     async def dispatch(self, request: Request, call_next):
         """Validate and sanitize incoming requests"""
+        if request.url.path in self.skip_paths and request.method == "GET":
+            return await call_next(request)
+        
         try:
             # Check request size
             content_length = request.headers.get('content-length')
@@ -38,7 +56,7 @@ class ValidationMiddleware(BaseHTTPMiddleware):
                     detail={
                         "error_code": "REQUEST_TOO_LARGE",
                         "error_message": f"Request size exceeds maximum allowed size of {self.max_request_size} bytes",
-                        "timestamp": datetime.utcnow().isoformat()
+                        "timestamp": utc_now_iso()
                     }
                 )
             
@@ -49,7 +67,7 @@ class ValidationMiddleware(BaseHTTPMiddleware):
                     detail={
                         "error_code": "INVALID_PATH",
                         "error_message": "Request path contains invalid characters",
-                        "timestamp": datetime.utcnow().isoformat()
+                        "timestamp": utc_now_iso()
                     }
                 )
             
@@ -66,7 +84,7 @@ class ValidationMiddleware(BaseHTTPMiddleware):
                 detail={
                     "error_code": "VALIDATION_ERROR",
                     "error_message": "Request validation failed",
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": utc_now_iso()
                 }
             )
     
@@ -77,11 +95,7 @@ class ValidationMiddleware(BaseHTTPMiddleware):
             return False
         
         # Check for suspicious patterns
-        for pattern in self.blocked_patterns:
-            if re.search(pattern, path, re.IGNORECASE):
-                return False
-        
-        return True
+        return self._blocked_path_regex.search(path) is None
 
 
 class QueryValidator:
@@ -128,7 +142,7 @@ class QueryValidator:
             "original_query": query,
             "sanitized_query": sanitized_query,
             "is_valid": True,
-            "validation_timestamp": datetime.utcnow().isoformat()
+            "validation_timestamp": utc_now_iso()
         }
     
     @staticmethod
@@ -244,7 +258,7 @@ def create_validation_error_response(error: ValidationError) -> Dict[str, Any]:
         "error_code": "VALIDATION_ERROR",
         "error_message": "Request validation failed",
         "validation_errors": errors,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": utc_now_iso()
     }
 
 
@@ -253,7 +267,7 @@ def create_custom_error_response(error_code: str, message: str, details: Optiona
     response = {
         "error_code": error_code,
         "error_message": message,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": utc_now_iso()
     }
     
     if details:
@@ -0,0 +1,33 @@
+"""
+Response classes and helpers for the NASDAQ Stock Agent API
+"""
+from typing import Any
+
+import orjson
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+from src.models.timestamps import utc_now_iso
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson (native datetime support, C-speed encoding)"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def api_error(status_code: int, error_code: str, error_message: str, **details: Any) -> HTTPException:
+    """HTTPException carrying the API's error_code/error_message detail"""
+    return HTTPException(
+        status_code=status_code,
+        detail={"error_code": error_code, "error_message": error_message, **details, "timestamp": utc_now_iso()}
+    )
+
+
+def status_error(status_code: int, error: str, **details: Any) -> HTTPException:
+    """HTTPException carrying the health and status endpoints' error detail"""
+    return HTTPException(
+        status_code=status_code,
+        detail={**details, "error": error, "timestamp": utc_now_iso()}
+    )
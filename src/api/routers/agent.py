@@ -1,104 +1,290 @@
 """
 Agent information and registry API router
 """
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any, Optional
+from fastapi import APIRouter, Response
+from typing import Any, Optional, Tuple
 import logging
-from datetime import datetime
+from types import MappingProxyType
+import orjson
+from src.api.responses import OrjsonResponse, api_error, utc_now_iso
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1/agent", tags=["Agent Registry"])
+router = APIRouter(prefix="/api/v1/agent", tags=["Agent Registry"], default_response_class=OrjsonResponse)
+
+# Static response bodies, built once at import and read-only; handlers only add timestamps and live status
+AGENT_INFO_TEMPLATE = MappingProxyType({
+    "agent_id": "nasdaq-stock-agent",
+    "agent_name": "NASDAQ Stock Agent",
+    "agent_domain": "financial analysis",
+    "agent_specialization": "NASDAQ stock analysis and investment recommendations",
+    "agent_description": "AI-powered agent that provides comprehensive stock analysis and investment recommendations for NASDAQ-listed securities using real-time market data and advanced AI analysis.",
+    "agent_capabilities": [
+        "stock analysis",
+        "ticker resolution",
+        "investment recommendations",
+        "market data",
+        "technical analysis",
+        "fundamental analysis"
+    ],
+    "supported_operations": [
+        {
+            "operation": "stock_analysis",
+            "description": "Analyze a stock and provide investment recommendation",
+            "examples": ["AAPL", "What about Tesla stock?", "Should I buy Microsoft?"]
+        },
+        {
+            "operation": "ticker_resolution",
+            "description": "Resolve company name to ticker symbol",
+            "examples": ["Apple", "Microsoft Corporation", "Tesla Inc"]
+        },
+        {
+            "operation": "investment_recommendation",
+            "description": "Get Buy/Hold/Sell recommendation with confidence score",
+            "examples": ["Recommend AAPL", "Investment advice for TSLA"]
+        }
+    ],
+    "rest_endpoint": "http://localhost:8000/api/v1",
+    "status": "active",
+    "nest_enabled": False
+})
+
+AGENT_CAPABILITIES = MappingProxyType({
+    "natural_language_processing": {
+        "supported_queries": [
+            "Company name queries (e.g., 'Apple', 'Microsoft')",
+            "Ticker symbol queries (e.g., 'AAPL', 'MSFT')",
+            "Investment questions (e.g., 'Should I buy Tesla?')",
+            "Analysis requests (e.g., 'Analyze Netflix stock')",
+            "Price inquiries (e.g., 'What's Apple's stock price?')"
+        ],
+        "supported_companies": "50+ major NASDAQ-listed companies",
+        "fuzzy_matching": True,
+        "typo_correction": True
+    },
+    "market_data_analysis": {
+        "data_sources": ["Yahoo Finance API"],
+        "historical_data_range": "6 months",
+        "update_frequency": "Real-time",
+        "supported_metrics": [
+            "Current price and daily range",
+            "Trading volume",
+            "Market capitalization",
+            "P/E ratio",
+            "Price change percentage",
+            "Moving averages (20, 50, 200-day)",
+            "RSI (Relative Strength Index)",
+            "Volatility analysis"
+        ]
+    },
+    "ai_analysis": {
+        "ai_model": "Anthropic Claude",
+        "recommendation_types": ["Buy", "Hold", "Sell"],
+        "confidence_scoring": "0-100 scale",
+        "analysis_factors": [
+            "Technical indicators",
+            "Price trends and momentum",
+            "Volume analysis",
+            "Fundamental metrics",
+            "Risk assessment"
+        ]
+    },
+    "api_features": {
+        "response_format": "JSON",
+        "max_concurrent_requests": 50,
+        "average_response_time": "< 10 seconds",
+        "caching": "Intelligent caching with TTL",
+        "rate_limiting": "100 requests per minute",
+        "logging": "Comprehensive audit trails"
+    },
+    "supported_exchanges": ["NASDAQ"],
+    "data_retention": "30 days",
+    "availability": "24/7"
+})
+
+REGISTRY_INFO_TEMPLATE = MappingProxyType({
+    "registry_type": "MongoDB",
+    "registry_url": "mongodb://localhost:27017/nasdaq_stock_agent/agent_registry",
+    "agent_id": "nasdaq-stock-agent-v1",
+    "registration_status": "active",
+    "registry_schema": {
+        "agent_id": "Unique identifier for the agent",
+        "agent_name": "Human-readable name",
+        "agent_domain": "Domain of expertise",
+        "agent_specialization": "Specific area of specialization",
+        "agent_description": "Detailed description of capabilities",
+        "agent_capabilities": "List of specific capabilities",
+        "registry_url": "URL of the registry storage",
+        "public_url": "Public API endpoint URL"
+    }
+})
+
+USAGE_EXAMPLES = MappingProxyType({
+    "basic_queries": [
+        {
+            "query": "Apple",
+            "description": "Simple company name query",
+            "expected_response": "Investment analysis for Apple Inc. (AAPL)"
+        },
+        {
+            "query": "MSFT",
+            "description": "Direct ticker symbol query", 
+            "expected_response": "Investment analysis for Microsoft Corporation (MSFT)"
+        }
+    ],
+    "natural_language_queries": [
+        {
+            "query": "What do you think about Tesla stock?",
+            "description": "Opinion-based investment question",
+            "expected_response": "Comprehensive analysis with Buy/Hold/Sell recommendation"
+        },
+        {
+            "query": "Should I buy Netflix?",
+            "description": "Direct investment advice question",
+            "expected_response": "Investment recommendation with confidence score and reasoning"
+        },
+        {
+            "query": "Analyze Amazon stock performance",
+            "description": "Analysis request",
+            "expected_response": "Detailed technical and fundamental analysis"
+        }
+    ],
+    "response_format": {
+        "analysis_id": "Unique identifier for the analysis",
+        "ticker": "Stock ticker symbol",
+        "company_name": "Full company name",
+        "current_price": "Current stock price",
+        "recommendation": "Buy/Hold/Sell recommendation",
+        "confidence_score": "Confidence level (0-100)",
+        "reasoning": "Detailed analysis reasoning",
+        "key_factors": "List of key factors influencing the recommendation",
+        "risk_assessment": "Risk evaluation",
+        "processing_time_ms": "Analysis processing time"
+    },
+    "error_handling": {
+        "invalid_company": {
+            "query": "XYZ Company",
+            "response": "Error with suggestions for valid companies"
+        },
+        "misspelled_name": {
+            "query": "Aple",
+            "response": "Automatic correction to 'Apple' with analysis"
+        }
+    }
+})
+
+# Pre-serialized bodies of the fully static endpoints; only the timestamp is spliced in per request
+CAPABILITIES_RESPONSE_PREFIX = b'{"success":true,"agent_capabilities":' + orjson.dumps(dict(AGENT_CAPABILITIES))
+USAGE_EXAMPLES_RESPONSE_PREFIX = b'{"success":true,"usage_examples":' + orjson.dumps(dict(USAGE_EXAMPLES))
+
+# Registry body with a placeholder for both its timestamps, substituted in one pass per request
+TIMESTAMP_PLACEHOLDER = b"__TS__"
+REGISTRY_INFO_RESPONSE_BODY = orjson.dumps({
+    "success": True,
+    "registry_info": {**REGISTRY_INFO_TEMPLATE, "last_updated": TIMESTAMP_PLACEHOLDER.decode()},
+    "timestamp": TIMESTAMP_PLACEHOLDER.decode()
+})
+
+
+def _static_json_response(body_prefix: bytes) -> Response:
+    """Complete a pre-serialized JSON body with the current timestamp"""
+    timestamp = utc_now_iso().encode()
+    return Response(
+        content=body_prefix + b',"timestamp":"' + timestamp + b'"}',
+        media_type="application/json"
+    )
+
+
+# Serialized /info body (without timestamp) and the NEST state it was built for; the rest of
+# the body is fixed for the life of the process, so it is only rebuilt when that state changes
+_agent_info_cache: Tuple[Optional[Tuple[Any, ...]], bytes] = (None, b"")
+
+
+def _get_nest_adapter():
+    """Get the NEST adapter, if the app has started one"""
+    try:
+        from src.api.app import get_nest_adapter
+    except ImportError:
+        return None
+    return get_nest_adapter()
+
+
+def _nest_state_key(nest_adapter) -> Tuple[Any, ...]:
+    """Identify the NEST state the /info body depends on"""
+    if not nest_adapter:
+        return (None, False, None, None)
+    config = getattr(nest_adapter, "config", None)
+    return (
+        nest_adapter,
+        nest_adapter.is_running(),
+        getattr(config, "agent_id", None),
+        getattr(config, "nest_public_url", None)
+    )
+
+
+async def _build_agent_info_prefix(nest_adapter) -> Tuple[bytes, bool]:
+    """Build the agent info body from the static template and the current NEST status.
+
+    The flag is False when the NEST status could not be read, so the body must not be cached.
+    """
+    complete = True
+    nest_enabled = False
+    a2a_endpoint = None
+    nest_agent_id = None
+    
+    try:
+        if nest_adapter:
+            nest_status = await nest_adapter.get_status()
+            nest_enabled = nest_status.get("nest_running", False)
+            nest_agent_id = nest_status.get("agent_id")
+            public_url = nest_status.get("public_url")
+            if public_url:
+                a2a_endpoint = f"{public_url}/a2a"
+    except Exception as e:
+        logger.warning("Failed to get NEST status: %s", e)
+        complete = False
+    
+    agent_info = dict(AGENT_INFO_TEMPLATE)
+    if nest_agent_id:
+        agent_info["agent_id"] = nest_agent_id
+    agent_info["nest_enabled"] = nest_enabled
+    
+    # Add A2A endpoint if NEST is enabled
+    if a2a_endpoint:
+        agent_info["a2a_endpoint"] = a2a_endpoint
+    
+    # Drop the closing brace so the timestamp can be appended per request
+    return orjson.dumps(agent_info)[:-1], complete
 
 
 @router.get("/info")
-async def get_agent_info() -> Dict[str, Any]:
+async def get_agent_info() -> Response:
     """
     Get NASDAQ Stock Agent information
     
     Returns comprehensive information about the agent including capabilities,
     specialization, registry details, and NEST integration status.
     """
+    global _agent_info_cache
+    
     try:
-        # Get NEST status
-        nest_enabled = False
-        a2a_endpoint = None
-        nest_agent_id = None
-        
-        try:
-            from src.api.app import get_nest_adapter
-            
-            nest_adapter = get_nest_adapter()
-            if nest_adapter:
-                nest_status = await nest_adapter.get_status()
-                nest_enabled = nest_status.get("nest_running", False)
-                nest_agent_id = nest_status.get("agent_id")
-                public_url = nest_status.get("public_url")
-                if public_url:
-                    a2a_endpoint = f"{public_url}/a2a"
-        except ImportError:
-            pass
-        except Exception as e:
-            logger.warning(f"Failed to get NEST status: {e}")
-        
-        # Build agent info response
-        agent_info = {
-            "agent_id": nest_agent_id if nest_agent_id else "nasdaq-stock-agent",
-            "agent_name": "NASDAQ Stock Agent",
-            "agent_domain": "financial analysis",
-            "agent_specialization": "NASDAQ stock analysis and investment recommendations",
-            "agent_description": "AI-powered agent that provides comprehensive stock analysis and investment recommendations for NASDAQ-listed securities using real-time market data and advanced AI analysis.",
-            "agent_capabilities": [
-                "stock analysis",
-                "ticker resolution",
-                "investment recommendations",
-                "market data",
-                "technical analysis",
-                "fundamental analysis"
-            ],
-            "supported_operations": [
-                {
-                    "operation": "stock_analysis",
-                    "description": "Analyze a stock and provide investment recommendation",
-                    "examples": ["AAPL", "What about Tesla stock?", "Should I buy Microsoft?"]
-                },
-                {
-                    "operation": "ticker_resolution",
-                    "description": "Resolve company name to ticker symbol",
-                    "examples": ["Apple", "Microsoft Corporation", "Tesla Inc"]
-                },
-                {
-                    "operation": "investment_recommendation",
-                    "description": "Get Buy/Hold/Sell recommendation with confidence score",
-                    "examples": ["Recommend AAPL", "Investment advice for TSLA"]
-                }
-            ],
-            "rest_endpoint": "http://localhost:8000/api/v1",
-            "status": "active",
-            "nest_enabled": nest_enabled,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        nest_adapter = _get_nest_adapter()
+        state_key = _nest_state_key(nest_adapter)
         
-        # Add A2A endpoint if NEST is enabled
-        if a2a_endpoint:
-            agent_info["a2a_endpoint"] = a2a_endpoint
+        cached_key, body_prefix = _agent_info_cache
+        if not body_prefix or cached_key != state_key:
+            body_prefix, complete = await _build_agent_info_prefix(nest_adapter)
+            _agent_info_cache = (state_key, body_prefix) if complete else (None, b"")
         
-        return agent_info
+        return _static_json_response(body_prefix)
         
     except Exception as e:
-        logger.error(f"Failed to get agent info: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error_code": "AGENT_INFO_FAILED",
-                "error_message": f"Failed to retrieve agent information: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
+        logger.error("Failed to get agent info: %s", e)
+        raise api_error(500, "AGENT_INFO_FAILED", f"Failed to retrieve agent information: {e}")
 
 
 @router.get("/capabilities")
-async def get_agent_capabilities() -> Dict[str, Any]:
+async def get_agent_capabilities() -> Response:
     """
     Get detailed agent capabilities and supported operations
     
@@ -106,79 +292,15 @@ async def get_agent_capabilities() -> Dict[str, Any]:
     and operational parameters.
     """
     try:
-        capabilities = {
-            "natural_language_processing": {
-                "supported_queries": [
-                    "Company name queries (e.g., 'Apple', 'Microsoft')",
-                    "Ticker symbol queries (e.g., 'AAPL', 'MSFT')",
-                    "Investment questions (e.g., 'Should I buy Tesla?')",
-                    "Analysis requests (e.g., 'Analyze Netflix stock')",
-                    "Price inquiries (e.g., 'What's Apple's stock price?')"
-                ],
-                "supported_companies": "50+ major NASDAQ-listed companies",
-                "fuzzy_matching": True,
-                "typo_correction": True
-            },
-            "market_data_analysis": {
-                "data_sources": ["Yahoo Finance API"],
-                "historical_data_range": "6 months",
-                "update_frequency": "Real-time",
-                "supported_metrics": [
-                    "Current price and daily range",
-                    "Trading volume",
-                    "Market capitalization",
-                    "P/E ratio",
-                    "Price change percentage",
-                    "Moving averages (20, 50, 200-day)",
-                    "RSI (Relative Strength Index)",
-                    "Volatility analysis"
-                ]
-            },
-            "ai_analysis": {
-                "ai_model": "Anthropic Claude",
-                "recommendation_types": ["Buy", "Hold", "Sell"],
-                "confidence_scoring": "0-100 scale",
-                "analysis_factors": [
-                    "Technical indicators",
-                    "Price trends and momentum",
-                    "Volume analysis",
-                    "Fundamental metrics",
-                    "Risk assessment"
-                ]
-            },
-            "api_features": {
-                "response_format": "JSON",
-                "max_concurrent_requests": 50,
-                "average_response_time": "< 10 seconds",
-                "caching": "Intelligent caching with TTL",
-                "rate_limiting": "100 requests per minute",
-                "logging": "Comprehensive audit trails"
-            },
-            "supported_exchanges": ["NASDAQ"],
-            "data_retention": "30 days",
-            "availability": "24/7"
-        }
-        
-        return {
-            "success": True,
-            "agent_capabilities": capabilities,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        return _static_json_response(CAPABILITIES_RESPONSE_PREFIX)
         
     except Exception as e:
-        logger.error(f"Failed to get agent capabilities: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error_code": "CAPABILITIES_FAILED",
-                "error_message": f"Failed to retrieve capabilities: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
+        logger.error("Failed to get agent capabilities: %s", e)
+        raise api_error(500, "CAPABILITIES_FAILED", f"Failed to retrieve capabilities: {e}")
 
 
 @router.get("/registry")
-async def get_registry_info() -> Dict[str, Any]:
+async def get_registry_info() -> Response:
     """
     Get agent registry information
     
@@ -186,44 +308,18 @@ async def get_registry_info() -> Dict[str, Any]:
     and registration details.
     """
     try:
-        registry_info = {
-            "registry_type": "MongoDB",
-            "registry_url": "mongodb://localhost:27017/nasdaq_stock_agent/agent_registry",
-            "agent_id": "nasdaq-stock-agent-v1",
-            "registration_status": "active",
-            "last_updated": datetime.utcnow().isoformat(),
-            "registry_schema": {
-                "agent_id": "Unique identifier for the agent",
-                "agent_name": "Human-readable name",
-                "agent_domain": "Domain of expertise",
-                "agent_specialization": "Specific area of specialization",
-                "agent_description": "Detailed description of capabilities",
-                "agent_capabilities": "List of specific capabilities",
-                "registry_url": "URL of the registry storage",
-                "public_url": "Public API endpoint URL"
-            }
-        }
-        
-        return {
-            "success": True,
-            "registry_info": registry_info,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        return Response(
+            content=REGISTRY_INFO_RESPONSE_BODY.replace(TIMESTAMP_PLACEHOLDER, utc_now_iso().encode()),
+            media_type="application/json"
+        )
         
     except Exception as e:
-        logger.error(f"Failed to get registry info: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error_code": "REGISTRY_INFO_FAILED",
-                "error_message": f"Failed to retrieve registry information: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
+        logger.error("Failed to get registry info: %s", e)
+        raise api_error(500, "REGISTRY_INFO_FAILED", f"Failed to retrieve registry information: {e}")
 
 
 @router.get("/examples")
-async def get_usage_examples() -> Dict[str, Any]:
+async def get_usage_examples() -> Response:
     """
     Get usage examples and sample queries
     
@@ -231,73 +327,8 @@ async def get_usage_examples() -> Dict[str, Any]:
     how to interact with the agent.
     """
     try:
-        examples = {
-            "basic_queries": [
-                {
-                    "query": "Apple",
-                    "description": "Simple company name query",
-                    "expected_response": "Investment analysis for Apple Inc. (AAPL)"
-                },
-                {
-                    "query": "MSFT",
-                    "description": "Direct ticker symbol query", 
-                    "expected_response": "Investment analysis for Microsoft Corporation (MSFT)"
-                }
-            ],
-            "natural_language_queries": [
-                {
-                    "query": "What do you think about Tesla stock?",
-                    "description": "Opinion-based investment question",
-                    "expected_response": "Comprehensive analysis with Buy/Hold/Sell recommendation"
-                },
-                {
-                    "query": "Should I buy Netflix?",
-                    "description": "Direct investment advice question",
-                    "expected_response": "Investment recommendation with confidence score and reasoning"
-                },
-                {
-                    "query": "Analyze Amazon stock performance",
-                    "description": "Analysis request",
-                    "expected_response": "Detailed technical and fundamental analysis"
-                }
-            ],
-            "response_format": {
-                "analysis_id": "Unique identifier for the analysis",
-                "ticker": "Stock ticker symbol",
-                "company_name": "Full company name",
-                "current_price": "Current stock price",
-                "recommendation": "Buy/Hold/Sell recommendation",
-                "confidence_score": "Confidence level (0-100)",
-                "reasoning": "Detailed analysis reasoning",
-                "key_factors": "List of key factors influencing the recommendation",
-                "risk_assessment": "Risk evaluation",
-                "processing_time_ms": "Analysis processing time"
-            },
-            "error_handling": {
-                "invalid_company": {
-                    "query": "XYZ Company",
-                    "response": "Error with suggestions for valid companies"
-                },
-                "misspelled_name": {
-                    "query": "Aple",
-                    "response": "Automatic correction to 'Apple' with analysis"
-                }
-            }
-        }
-        
-        return {
-            "success": True,
-            "usage_examples": examples,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        return _static_json_response(USAGE_EXAMPLES_RESPONSE_PREFIX)
         
     except Exception as e:
-        logger.error(f"Failed to get usage examples: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error_code": "EXAMPLES_FAILED",
-                "error_message": f"Failed to retrieve usage examples: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
\ No newline at end of file
+        logger.error("Failed to get usage examples: %s", e)
+        raise api_error(500, "EXAMPLES_FAILED", f"Failed to retrieve usage examples: {e}")
\ No newline at end of file
@@ -1,25 +1,59 @@
 """
 Stock analysis API router for NASDAQ Stock Agent
 """
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from typing import Dict, Any, Optional
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from typing import Dict, Any, Optional, AsyncIterator
+import asyncio
 import logging
+import orjson
 from datetime import datetime
 from src.models.analysis import AnalysisRequest, AnalysisResponse, ErrorResponse
 from src.agents.stock_analysis_agent import agent_orchestrator
 from src.services.logging_service import logging_service
 from src.services.logging_middleware import performance_monitor
+from src.api.responses import OrjsonResponse, api_error, utc_now_iso
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1", tags=["Stock Analysis"])
+router = APIRouter(prefix="/api/v1", tags=["Stock Analysis"], default_response_class=OrjsonResponse)
 
+# Comment frames sent on an idle event stream so proxies do not time it out
+SSE_KEEPALIVE_INTERVAL = 15.0
 
-@router.post("/analyze", response_model=AnalysisResponse)
+ANALYSIS_FAILED_SUGGESTIONS = (
+    "Try using a specific company name like 'Apple' or 'Microsoft'",
+    "Make sure the company is listed on NASDAQ",
+    "Check your spelling and try again"
+)
+
+
+# The /analyze body is parsed by hand, so its schema is declared for the OpenAPI docs here
+ANALYZE_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": AnalysisRequest.model_json_schema()}}
+    }
+}
+
+
+async def _parse_analysis_request(http_request: Request) -> AnalysisRequest:
+    """Parse and validate the request body in one pass, reporting errors like FastAPI does"""
+    try:
+        return AnalysisRequest.model_validate_json(await http_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+
+@router.post("/analyze", response_model=AnalysisResponse, openapi_extra=ANALYZE_REQUEST_BODY)
 async def analyze_stock(
-    request: AnalysisRequest,
+    http_request: Request,
     background_tasks: BackgroundTasks
-) -> AnalysisResponse:
+) -> Response:
     """
     Analyze a stock using natural language query
     
@@ -39,7 +73,29 @@ async def analyze_stock(
     - Current price and market data
     - Detailed reasoning and key factors
     - Risk assessment
+    
+    Send `Accept: text/event-stream` to receive a `progress` event immediately and
+    the analysis as a `result` (or `error`) event when it completes.
     """
+    request = await _parse_analysis_request(http_request)
+    
+    # Clients that accept an event stream get an immediate progress frame and the result when ready
+    if "text/event-stream" in http_request.headers.get("accept", ""):
+        return StreamingResponse(
+            _analysis_event_stream(request, background_tasks),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"}
+        )
+    
+    response = await _run_analysis(request, background_tasks)
+    
+    # Serialize the model directly; returning a Response skips FastAPI's
+    # response_model re-validation and jsonable_encoder pass
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+async def _run_analysis(request: AnalysisRequest, background_tasks: BackgroundTasks) -> AnalysisResponse:
+    """Run the analysis and queue its metrics and logging; failures raise an ANALYSIS_FAILED error"""
     start_time = datetime.utcnow()
     
     try:
@@ -64,7 +120,7 @@ async def analyze_stock(
             response
         )
         
-        logger.info(f"Analysis completed for query: '{request.query}' -> {response.ticker}")
+        logger.info("Analysis completed for query: '%s' -> %s", request.query, response.ticker)
         return response
         
     except Exception as e:
@@ -88,22 +144,45 @@ async def analyze_stock(
             500
         )
         
-        logger.error(f"Analysis failed for query '{request.query}': {e}")
+        logger.error("Analysis failed for query '%s': %s", request.query, e)
         
         # Return structured error response
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error_code": "ANALYSIS_FAILED",
-                "error_message": f"Stock analysis failed: {str(e)}",
-                "suggestions": [
-                    "Try using a specific company name like 'Apple' or 'Microsoft'",
-                    "Make sure the company is listed on NASDAQ",
-                    "Check your spelling and try again"
-                ],
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
+        raise api_error(500, "ANALYSIS_FAILED", f"Stock analysis failed: {e}",
+                        suggestions=ANALYSIS_FAILED_SUGGESTIONS)
+
+
+def _sse_event(event: str, data: bytes) -> bytes:
+    """Encode one server-sent event frame"""
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
+async def _analysis_event_stream(request: AnalysisRequest,
+                                 background_tasks: BackgroundTasks) -> AsyncIterator[bytes]:
+    """Stream a progress frame, keepalives while the analysis runs, then a result or error frame"""
+    yield _sse_event("progress", orjson.dumps({
+        "status": "analyzing",
+        "query": request.query,
+        "timestamp": utc_now_iso()
+    }))
+    
+    task = asyncio.create_task(_run_analysis(request, background_tasks))
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=SSE_KEEPALIVE_INTERVAL)
+            if done:
+                break
+            yield b": keepalive\n\n"
+        
+        try:
+            response = task.result()
+        except HTTPException as e:
+            yield _sse_event("error", orjson.dumps(e.detail))
+        else:
+            yield _sse_event("result", response.model_dump_json().encode())
+    finally:
+        # The client went away mid-analysis
+        if not task.done():
+            task.cancel()
 
 
 @router.get("/analyze/{analysis_id}")
@@ -121,33 +200,19 @@ async def get_analysis_by_id(analysis_id: str) -> Dict[str, Any]:
         analysis = await logging_service.get_analysis_by_id(analysis_id)
         
         if not analysis:
-            raise HTTPException(
-                status_code=404,
-                detail={
-                    "error_code": "ANALYSIS_NOT_FOUND",
-                    "error_message": f"Analysis with ID '{analysis_id}' not found",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            )
+            raise api_error(404, "ANALYSIS_NOT_FOUND", f"Analysis with ID '{analysis_id}' not found")
         
         return {
             "success": True,
             "analysis": analysis,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now_iso()
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to retrieve analysis {analysis_id}: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error_code": "RETRIEVAL_FAILED",
-                "error_message": f"Failed to retrieve analysis: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
+        logger.error("Failed to retrieve analysis %s: %s", analysis_id, e)
+        raise api_error(500, "RETRIEVAL_FAILED", f"Failed to retrieve analysis: {e}")
 
 
 @router.get("/analyses/recent")
@@ -179,19 +244,12 @@ async def get_recent_analyses(
             "count": len(analyses),
             "ticker_filter": ticker,
             "analyses": analyses,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now_iso()
         }
         
     except Exception as e:
-        logger.error(f"Failed to get recent analyses: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error_code": "RETRIEVAL_FAILED",
-                "error_message": f"Failed to retrieve recent analyses: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
+        logger.error("Failed to get recent analyses: %s", e)
+        raise api_error(500, "RETRIEVAL_FAILED", f"Failed to retrieve recent analyses: {e}")
 
 
 @router.get("/analyses/search")
@@ -248,12 +306,5 @@ async def search_analyses(
         }
         
     except Exception as e:
-        logger.error(f"Failed to search analyses: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error_code": "SEARCH_FAILED",
-                "error_message": f"Analysis search failed: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
\ No newline at end of file
+        logger.error("Failed to search analyses: %s", e)
+        raise api_error(500, "SEARCH_FAILED", f"Analysis search failed: {e}")
\ No newline at end of file
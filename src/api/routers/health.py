@@ -1,15 +1,18 @@
 """
 Health check and system status API router
 """
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from fastapi import APIRouter, Response
+from typing import Dict, Any, Awaitable
+import asyncio
 import logging
-from datetime import datetime
+import time
+import orjson
 from src.services.logging_middleware import monitoring_service, performance_monitor
 from src.agents.stock_analysis_agent import agent_orchestrator
 from src.services.market_data_service import market_data_service
 from src.services.investment_analysis import comprehensive_analysis_service
 from src.core.dependencies import get_mcp_server
+from src.api.responses import OrjsonResponse, status_error, utc_now_iso
 
 logger = logging.getLogger(__name__)
 
@@ -70,111 +73,119 @@ async def get_nest_status() -> Dict[str, Any]:
             "message": "NEST integration not available (python-a2a not installed)"
         }
     except Exception as e:
-        logger.error(f"Error getting NEST status: {e}")
+        logger.error("Error getting NEST status: %s", e)
         return {
             "nest_enabled": False,
             "nest_status": "error",
             "error": str(e)
         }
 
-router = APIRouter(tags=["Health & Status"])
+router = APIRouter(tags=["Health & Status"], default_response_class=OrjsonResponse)
+
+# Serialized /health body and the second it was built; probes within the same second reuse it
+_health_response_cache = (0, b"")
+
+# Upper bound on each component probe in /status so one hung dependency cannot stall it
+STATUS_PROBE_TIMEOUT = 2.0
 
 
 @router.get("/health")
-async def health_check() -> Dict[str, Any]:
+async def health_check() -> Response:
     """
     Basic health check endpoint
     
     Returns simple health status for load balancers and monitoring systems.
     Includes NEST integration status.
     """
+    global _health_response_cache
+    
     try:
-        # Get NEST status
-        nest_status = await get_nest_status()
+        now = int(time.time())
+        if now != _health_response_cache[0]:
+            # Get NEST status
+            nest_status = await get_nest_status()
+            
+            _health_response_cache = (now, orjson.dumps({
+                "status": "healthy",
+                "service": "NASDAQ Stock Agent",
+                "version": "1.0.0",
+                "nest": nest_status,
+                "timestamp": utc_now_iso()
+            }))
         
-        return {
-            "status": "healthy",
-            "service": "NASDAQ Stock Agent",
-            "version": "1.0.0",
-            "nest": nest_status,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        return Response(content=_health_response_cache[1], media_type="application/json")
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        raise HTTPException(
-            status_code=503,
-            detail={
-                "status": "unhealthy",
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
+        logger.error("Health check failed: %s", e)
+        raise status_error(503, str(e), status="unhealthy")
 
 
 @router.get("/health/detailed")
-async def detailed_health_check() -> Dict[str, Any]:
+async def detailed_health_check() -> OrjsonResponse:
     """
     Detailed health check with service status
     
     Returns comprehensive health information for all system components including NEST.
     """
     try:
-        # Get comprehensive system status
-        system_status = await monitoring_service.get_comprehensive_status()
-        
-        # Get NEST status
-        nest_status = await get_nest_status()
+        # Get comprehensive system status and NEST status concurrently
+        system_status, nest_status = await asyncio.gather(
+            monitoring_service.get_comprehensive_status(),
+            get_nest_status()
+        )
         
-        return {
+        return OrjsonResponse({
             "overall_status": system_status.get("status", "unknown"),
             "system_health": system_status,
             "nest": nest_status,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": utc_now_iso()
+        })
         
     except Exception as e:
-        logger.error(f"Detailed health check failed: {e}")
-        raise HTTPException(
-            status_code=503,
-            detail={
-                "status": "unhealthy",
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
+        logger.error("Detailed health check failed: %s", e)
+        raise status_error(503, str(e), status="unhealthy")
+
+
+async def _get_mcp_health() -> Dict[str, Any]:
+    """Get MCP server health, if the server is available"""
+    mcp_server = await get_mcp_server()
+    return mcp_server.get_health_status() if mcp_server else {"status": "not_available"}
+
+
+async def _probe(coro: Awaitable[Dict[str, Any]], component: str,
+                 timeout: float = STATUS_PROBE_TIMEOUT) -> Dict[str, Any]:
+    """Await a status probe, mapping a timeout or error to a status dict"""
+    try:
+        return await asyncio.wait_for(coro, timeout)
+    except asyncio.TimeoutError:
+        logger.warning("Status probe for %s timed out after %ss", component, timeout)
+        return {"status": "timeout", "component": component}
+    except Exception as e:
+        return {"status": "error", "component": component, "message": str(e)}
 
 
 @router.get("/status")
-async def system_status() -> Dict[str, Any]:
+async def system_status() -> OrjsonResponse:
     """
     Get comprehensive system status and metrics
     
     Returns detailed information about system performance, health, and metrics including NEST.
     """
     try:
-        # Get performance metrics
-        performance_metrics = await performance_monitor.get_metrics()
-        
-        # Get agent health
-        agent_health = await agent_orchestrator.get_health_status()
-        
-        # Get market data service health
-        market_health = await market_data_service.get_service_health()
-        
-        # Get analysis service health
-        analysis_health = await comprehensive_analysis_service.get_service_health()
-        
-        # Get MCP server health
-        try:
-            mcp_server = await get_mcp_server()
-            mcp_health = mcp_server.get_health_status() if mcp_server else {"status": "not_available"}
-        except Exception:
-            mcp_health = {"status": "error", "message": "Failed to get MCP server status"}
-        
-        # Get NEST status
-        nest_status = await get_nest_status()
+        # Query performance metrics and every component's health concurrently; a failing
+        # or hung component is reported in place instead of failing the whole status call
+        (performance_metrics, agent_health, market_health,
+         analysis_health, mcp_health, nest_status) = await asyncio.gather(
+            _probe(performance_monitor.get_metrics(), "performance_monitor"),
+            _probe(agent_orchestrator.get_health_status(), "agent_orchestrator"),
+            _probe(market_data_service.get_service_health(), "market_data_service"),
+            _probe(comprehensive_analysis_service.get_service_health(), "analysis_service"),
+            _probe(_get_mcp_health(), "mcp_server"),
+            _probe(get_nest_status(), "nest_adapter")
+        )
         
-        return {
+        # Status payloads are plain JSON types, so hand them straight to orjson
+        # instead of letting FastAPI walk them with jsonable_encoder first
+        return OrjsonResponse({
             "service": "NASDAQ Stock Agent",
             "version": "1.0.0",
             "status": "operational",
@@ -186,22 +197,16 @@ async def system_status() -> Dict[str, Any]:
                 "mcp_server": mcp_health,
                 "nest_adapter": nest_status
             },
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": utc_now_iso()
+        })
         
     except Exception as e:
-        logger.error(f"System status check failed: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": f"Status check failed: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
+        logger.error("System status check failed: %s", e)
+        raise status_error(500, f"Status check failed: {e}")
 
 
 @router.get("/metrics")
-async def get_metrics() -> Dict[str, Any]:
+async def get_metrics() -> OrjsonResponse:
     """
     Get system performance metrics
     
@@ -211,21 +216,15 @@ async def get_metrics() -> Dict[str, Any]:
     try:
         metrics = await performance_monitor.get_metrics()
         
-        return {
+        return OrjsonResponse({
             "success": True,
             "metrics": metrics,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": utc_now_iso()
+        })
         
     except Exception as e:
-        logger.error(f"Failed to get metrics: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": f"Metrics retrieval failed: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
+        logger.error("Failed to get metrics: %s", e)
+        raise status_error(500, f"Metrics retrieval failed: {e}")
 
 
 @router.post("/metrics/reset")
@@ -242,22 +241,16 @@ async def reset_metrics() -> Dict[str, Any]:
         return {
             "success": True,
             "message": "Performance metrics have been reset",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now_iso()
         }
         
     except Exception as e:
-        logger.error(f"Failed to reset metrics: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": f"Metrics reset failed: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
+        logger.error("Failed to reset metrics: %s", e)
+        raise status_error(500, f"Metrics reset failed: {e}")
 
 
 @router.get("/mcp")
-async def mcp_server_status() -> Dict[str, Any]:
+async def mcp_server_status() -> OrjsonResponse:
     """
     Get MCP (Model Context Protocol) server status
     
@@ -271,30 +264,24 @@ async def mcp_server_status() -> Dict[str, Any]:
             return {
                 "status": "not_available",
                 "message": "MCP server not initialized",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_now_iso()
             }
         
         # Get comprehensive MCP server status
         server_status = mcp_server.get_server_status()
         health_status = mcp_server.get_health_status()
         
-        # Validate tool schemas
+        # Tool schema validation result, cached by the registry until its tools change
         tool_validation = await mcp_server.validate_tool_schemas()
         
-        return {
+        return OrjsonResponse({
             "success": True,
             "server_status": server_status,
             "health_status": health_status,
             "tool_validation": tool_validation,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": utc_now_iso()
+        })
         
     except Exception as e:
-        logger.error(f"Failed to get MCP server status: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": f"MCP server status check failed: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        )
+        logger.error("Failed to get MCP server status: %s", e)
+        raise status_error(500, f"MCP server status check failed: {e}")
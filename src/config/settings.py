@@ -21,15 +21,25 @@ class Settings(BaseSettings):
     # Anthropic API Configuration
     anthropic_api_key: Optional[str] = Field(default=None, description="Anthropic API key")
     anthropic_model: str = Field(default="claude-3-sonnet-20240229", description="Anthropic model to use")
+    anthropic_max_connections: int = Field(default=50, description="Maximum pooled connections to the Anthropic API")
+    anthropic_max_keepalive_connections: int = Field(default=10, description="Idle connections kept warm in the Anthropic connection pool")
     
     # Yahoo Finance Configuration
     yfinance_timeout: int = Field(default=30, description="Yahoo Finance API timeout in seconds")
+    yfinance_max_workers: int = Field(default=16, description="Threads available for concurrent blocking Yahoo Finance calls")
+    yfinance_warmup_on_startup: bool = Field(default=True, description="Open the Yahoo Finance session at startup instead of on the first query")
     
     # Caching Configuration
     cache_ttl_seconds: int = Field(default=300, description="Cache TTL in seconds (5 minutes)")
     
     # Logging Configuration
     log_retention_days: int = Field(default=30, description="Log retention period in days")
+    log_batch_size: int = Field(default=100, description="Maximum analysis/error log entries written per batch")
+    log_flush_interval_ms: int = Field(default=50, description="Longest time a log entry waits before its batch is written")
+    log_max_pending_batches: int = Field(default=100, description="Batches allowed to wait for the log writer thread before new ones are dropped")
+    error_log_max_per_minute: int = Field(default=60, description="Error log entries kept per error type and path each minute")
+    error_log_stack_max_frames: int = Field(default=30, description="Innermost stack frames kept in an error log entry")
+    error_log_stack_max_chars: int = Field(default=16000, description="Longest stack trace stored in an error log entry")
     
     # Rate Limiting
     rate_limit_requests: int = Field(default=100, description="Rate limit requests per minute")
@@ -44,6 +54,7 @@ class Settings(BaseSettings):
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
+        frozen = True
 
 
 # Global settings instance
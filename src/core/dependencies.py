@@ -35,9 +35,6 @@ class ServiceContainer:
         try:
             logger.info("Initializing NASDAQ Stock Agent services...")
             
-            # Initialize database connection
-            await self._initialize_database()
-            
             # Initialize monitoring
             await self._initialize_monitoring()
             
@@ -76,25 +73,6 @@ class ServiceContainer:
             await self.shutdown()
             raise
     
-    async def _initialize_database(self):
-        """Initialize database connection and schema"""
-        logger.info("Initializing database connection...")
-        
-        try:
-            # Connect to MongoDB
-            await mongodb_client.connect()
-            
-            # Verify database health
-            health = await mongodb_client.health_check()
-            if health.get('status') != 'healthy':
-                raise Exception(f"Database health check failed: {health}")
-            
-            logger.info("Database initialized successfully")
-            
-        except Exception as e:
-            logger.error(f"Database initialization failed: {e}")
-            raise
-    
     async def _initialize_monitoring(self):
         """Initialize monitoring and metrics collection"""
         logger.info("Initializing monitoring service...")
@@ -200,14 +178,9 @@ class ServiceContainer:
         logger.info("Initializing logging service...")
         
         try:
-            # Initialize logging service (starts background tasks)
-            await logging_service.initialize()
-            
-            # Test logging service
-            stats = await logging_service.get_logging_statistics()
-            
-            if stats.get('database_health', {}).get('status') != 'healthy':
-                logger.warning(f"Logging service database health issue: {stats}")
+            # File loggers are set up when the service is constructed; just verify they exist
+            if self._logging_status() != 'healthy':
+                logger.warning("Logging service file loggers are not configured")
             
             logger.info("Logging service initialized successfully")
             
@@ -240,6 +213,12 @@ class ServiceContainer:
             # Don't raise - MCP server failure shouldn't prevent app startup
             logger.warning("Continuing without MCP server")
     
+    def _logging_status(self) -> str:
+        """Health of the file-based logging service"""
+        if logging_service.analyses_logger and logging_service.errors_logger:
+            return 'healthy'
+        return 'unhealthy'
+    
     def _register_services(self):
         """Register all services in the container"""
         self._services = {
@@ -262,26 +241,17 @@ class ServiceContainer:
         health_checks = []
         
         try:
-            # Check database health
-            db_health = await mongodb_client.health_check()
-            health_checks.append(('database', db_health.get('status')))
+            # Run the independent health probes concurrently
+            market_health, analysis_health, agent_health = await asyncio.gather(
+                market_data_service.get_service_health(),
+                comprehensive_analysis_service.get_service_health(),
+                agent_orchestrator.get_health_status()
+            )
             
-            # Check market data service health
-            market_health = await market_data_service.get_service_health()
             health_checks.append(('market_data', market_health.get('overall_status')))
-            
-            # Check analysis service health
-            analysis_health = await comprehensive_analysis_service.get_service_health()
             health_checks.append(('analysis', analysis_health.get('overall_status')))
-            
-            # Check agent health
-            agent_health = await agent_orchestrator.get_health_status()
             health_checks.append(('agent', agent_health.get('overall_status')))
-            
-            # Check logging service health
-            logging_stats = await logging_service.get_logging_statistics()
-            logging_health = logging_stats.get('database_health', {}).get('status')
-            health_checks.append(('logging', logging_health))
+            health_checks.append(('logging', self._logging_status()))
             
             # Check MCP server health
             mcp_health = mcp_server.get_health_status()
@@ -360,17 +330,13 @@ class ServiceContainer:
             if mcp_server:
                 await mcp_server.stop_server()
             
-            # Shutdown logging service
+            # Flush buffered log entries
             if logging_service:
-                logging_service.shutdown()
+                await logging_service.flush()
             
             # Shutdown cache
             if global_cache:
-                global_cache.shutdown()
-            
-            # Disconnect from database
-            if mongodb_client:
-                await mongodb_client.disconnect()
+                await global_cache.shutdown()
             
             self._initialized = False
             self._services.clear()
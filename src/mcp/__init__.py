@@ -12,6 +12,7 @@ try:
     from .request_handler import MCPRequestHandler
     from .response_formatter import MCPResponseFormatter
     from .tools import MCPToolImplementations, mcp_tool_implementations
+    from .query_batcher import AgentQueryBatcher
     
     __all__ = [
         'MCPServer',
@@ -22,6 +23,7 @@ try:
         'MCPResponseFormatter',
         'MCPToolImplementations',
         'mcp_tool_implementations',
+        'AgentQueryBatcher',
         'MCPToolSchema',
         'MCPResponse',
         'MCPRequest'
@@ -31,6 +31,7 @@ from .tool_registry import MCPToolRegistry, mcp_tool_registry
 from .request_handler import MCPRequestHandler
 from .response_formatter import MCPResponseFormatter
 from .schemas import MCPResponse
+from src.models.timestamps import utc_now_iso
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,7 @@ class MCPServer:
         self.is_running = False
         self.connection_count = 0
         self.start_time = None
+        self._mcp_tools_cache: tuple = (-1, [])
         
         # Server configuration
         self.config = {
@@ -73,20 +75,13 @@ class MCPServer:
             async def handle_list_tools() -> ListToolsResult:
                 """Handle MCP list tools request"""
                 try:
-                    tools = []
-                    for tool_schema in self.tool_registry.get_all_tool_schemas():
-                        tool = Tool(
-                            name=tool_schema.name,
-                            description=tool_schema.description,
-                            inputSchema=tool_schema.parameters
-                        )
-                        tools.append(tool)
+                    tools = self._get_mcp_tools()
                     
-                    logger.info(f"Listed {len(tools)} MCP tools")
+                    logger.debug("Listed %s MCP tools", len(tools))
                     return ListToolsResult(tools=tools)
                     
                 except Exception as e:
-                    logger.error(f"Failed to list MCP tools: {e}")
+                    logger.error("Failed to list MCP tools: %s", e)
                     return ListToolsResult(tools=[])
             
             # Register tool call handler
@@ -94,7 +89,7 @@ class MCPServer:
             async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
                 """Handle MCP tool call request"""
                 try:
-                    logger.info(f"MCP tool call: {name} with arguments: {arguments}")
+                    logger.debug("MCP tool call: %s", name)
                     
                     # Execute tool through request handler
                     mcp_response = await self.request_handler.handle_tool_call(name, arguments)
@@ -109,14 +104,14 @@ class MCPServer:
                     result = CallToolResult(content=content, isError=mcp_response.isError)
                     
                     if not mcp_response.isError:
-                        logger.info(f"MCP tool call completed successfully: {name}")
+                        logger.debug("MCP tool call completed successfully: %s", name)
                     else:
-                        logger.warning(f"MCP tool call failed: {name}")
+                        logger.warning("MCP tool call failed: %s", name)
                     
                     return result
                     
                 except Exception as e:
-                    logger.error(f"MCP tool call handler failed for '{name}': {e}")
+                    logger.error("MCP tool call handler failed for '%s': %s", name, e)
                     error_content = [TextContent(type="text", text=f"Tool execution failed: {str(e)}")]
                     return CallToolResult(content=error_content, isError=True)
             
@@ -124,7 +119,7 @@ class MCPServer:
             return server
             
         except Exception as e:
-            logger.error(f"Failed to create MCP server: {e}")
+            logger.error("Failed to create MCP server: %s", e)
             return None
     
     async def start_server(self, host: str = "localhost", port: int = 8001) -> bool:
@@ -146,13 +141,13 @@ class MCPServer:
             self.start_time = datetime.utcnow()
             self.is_running = True
             
-            logger.info(f"MCP server started successfully on {host}:{port}")
-            logger.info(f"Available tools: {', '.join(self.tool_registry.get_tool_names())}")
+            logger.info("MCP server started successfully on %s:%s", host, port)
+            logger.info("Available tools: %s", ', '.join(self.tool_registry.get_tool_names()))
             
             return True
             
         except Exception as e:
-            logger.error(f"Failed to start MCP server: {e}")
+            logger.error("Failed to start MCP server: %s", e)
             self.is_running = False
             return False
     
@@ -186,7 +181,7 @@ class MCPServer:
                 logger.error("stdio_server not available")
                 
         except Exception as e:
-            logger.error(f"MCP stdio server failed: {e}")
+            logger.error("MCP stdio server failed: %s", e)
             logger.error(traceback.format_exc())
         finally:
             self.is_running = False
@@ -206,13 +201,29 @@ class MCPServer:
             logger.info("MCP server stopped successfully")
             
         except Exception as e:
-            logger.error(f"Failed to stop MCP server: {e}")
+            logger.error("Failed to stop MCP server: %s", e)
+    
+    def _get_mcp_tools(self) -> List["Tool"]:
+        """Tool models for list_tools, rebuilt only when the registry version changes"""
+        version = self.tool_registry.version
+        if self._mcp_tools_cache[0] != version:
+            self._mcp_tools_cache = (
+                version,
+                [Tool(**tool_dict) for tool_dict in self.tool_registry.list_tools_for_mcp()]
+            )
+        return list(self._mcp_tools_cache[1])
+    
+    def _get_uptime_seconds(self) -> int:
+        """Seconds since the server was started, 0 if not started"""
+        if self.start_time:
+            return int((datetime.utcnow() - self.start_time).total_seconds())
+        return 0
     
     def get_server_status(self) -> Dict[str, Any]:
         """Get MCP server status information"""
-        uptime_seconds = 0
-        if self.start_time:
-            uptime_seconds = int((datetime.utcnow() - self.start_time).total_seconds())
+        uptime_seconds = self._get_uptime_seconds()
+        
+        registry_info = self.tool_registry.get_registry_info()
         
         return {
             'service': 'MCPServer',
@@ -220,15 +231,13 @@ class MCPServer:
             'config': self.config,
             'uptime_seconds': uptime_seconds,
             'connection_count': self.connection_count,
-            'available_tools': len(self.tool_registry.get_tool_names()),
-            'tool_registry_info': self.tool_registry.get_registry_info(),
-            'timestamp': datetime.utcnow().isoformat()
+            'available_tools': registry_info['total_tools'],
+            'tool_registry_info': registry_info,
+            'timestamp': utc_now_iso()
         }
     
     def get_health_status(self) -> Dict[str, Any]:
         """Get health status for monitoring"""
-        status = self.get_server_status()
-        
         # Determine health based on server state
         if self.is_running and self.server:
             health_status = 'healthy'
@@ -242,42 +251,23 @@ class MCPServer:
             'status': health_status,
             'is_running': self.is_running,
             'has_server_instance': self.server is not None,
-            'available_tools': len(self.tool_registry.get_tool_names()),
-            'uptime_seconds': status['uptime_seconds'],
-            'timestamp': datetime.utcnow().isoformat()
+            'available_tools': self.tool_registry.tool_count,
+            'uptime_seconds': self._get_uptime_seconds(),
+            'timestamp': utc_now_iso()
         }
     
     async def validate_tool_schemas(self) -> Dict[str, Any]:
         """Validate all registered tool schemas"""
-        validation_results = {
-            'valid_tools': [],
-            'invalid_tools': [],
-            'total_tools': 0
-        }
-        
         try:
-            for tool_schema in self.tool_registry.get_all_tool_schemas():
-                validation_results['total_tools'] += 1
-                
-                # Basic schema validation
-                if (tool_schema.name and 
-                    tool_schema.description and 
-                    isinstance(tool_schema.parameters, dict)):
-                    validation_results['valid_tools'].append(tool_schema.name)
-                else:
-                    validation_results['invalid_tools'].append({
-                        'name': tool_schema.name,
-                        'error': 'Missing required fields or invalid parameters'
-                    })
-            
-            logger.info(f"Tool schema validation: {len(validation_results['valid_tools'])} valid, "
-                       f"{len(validation_results['invalid_tools'])} invalid")
-            
+            return self.tool_registry.check_tool_schemas()
         except Exception as e:
-            logger.error(f"Tool schema validation failed: {e}")
-            validation_results['error'] = str(e)
-        
-        return validation_results
+            logger.error("Tool schema validation failed: %s", e)
+            return {
+                'valid_tools': [],
+                'invalid_tools': [],
+                'total_tools': 0,
+                'error': str(e)
+            }
 
 
 # Global MCP server instance
@@ -0,0 +1,94 @@
+"""
+Coalescing of identical agent queries issued by MCP tool calls
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, Set, Hashable, Callable, Awaitable
+
+logger = logging.getLogger(__name__)
+
+
+class AgentQueryBatcher:
+    """Shares one agent run between identical queries that are in flight at the same time"""
+
+    def __init__(self, query_func: Callable[[str], Awaitable[Dict[str, Any]]]):
+        self.query_func = query_func
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = {
+            'queries': 0,
+            'coalesced_queries': 0
+        }
+
+    def submit(self, query: str) -> "asyncio.Future[Dict[str, Any]]":
+        """Run an agent query, joining an identical one that is already running"""
+        return self.run(query, self.query_func, query)
+
+    def run(self, key: Hashable, func: Callable[..., Awaitable[Any]], *args) -> asyncio.Future:
+        """Start func(*args) unless work under the same key is in flight; return the shared future.
+
+        Callers should await the future through asyncio.shield so one caller's
+        cancellation does not cancel the run for the others.
+        """
+        loop = asyncio.get_running_loop()
+        self._stats['queries'] += 1
+
+        future = self._inflight.get(key)
+        if future is not None and not future.done() and future.get_loop() is loop:
+            self._stats['coalesced_queries'] += 1
+            return future
+
+        future = loop.create_future()
+        self._inflight[key] = future
+        # Forget the key when the run finishes, not when any one caller stops waiting
+        future.add_done_callback(lambda done, key=key: self._forget(key, done))
+
+        task = loop.create_task(self._run(future, func, *args))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return future
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        """Drop a finished future from the in-flight table"""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    async def _run(self, future: asyncio.Future, func: Callable[..., Awaitable[Any]], *args) -> None:
+        """Run the work and settle the shared future with its outcome"""
+        try:
+            result = await func(*args)
+        except asyncio.CancelledError:
+            if not future.done():
+                future.cancel()
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    async def shutdown(self) -> None:
+        """Cancel running queries and fail every pending future so no caller waits forever"""
+        loop = asyncio.get_running_loop()
+
+        # Work started on another (closed) event loop can neither be awaited nor settled from here
+        tasks = [task for task in self._tasks if task.get_loop() is loop]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        for future in self._inflight.values():
+            if not future.done() and future.get_loop() is loop:
+                future.cancel()
+        self._inflight.clear()
+        logger.info("Agent query batcher shut down")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics"""
+        return {
+            **self._stats,
+            'inflight_queries': len(self._inflight)
+        }
@@ -3,20 +3,17 @@ MCP Request Handler for routing tool calls to appropriate services
 """
 
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime
+import time
+from typing import Dict, Any
+
+import orjson
 
 from .tool_registry import MCPToolRegistry
 from .schemas import MCPResponse
 from .tools import mcp_tool_implementations
 
-# Use absolute imports to avoid circular import issues
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from agents.stock_analysis_agent import agent_orchestrator
-from services.logging_service import logging_service
+from src.services.logging_service import logging_service
+from src.models.timestamps import utc_now_iso
 
 logger = logging.getLogger(__name__)
 
@@ -26,15 +23,11 @@ class MCPRequestHandler:
     
     def __init__(self, tool_registry: MCPToolRegistry):
         self.tool_registry = tool_registry
-        self.agent_orchestrator = None
         self.is_initialized = False
     
     async def initialize(self) -> None:
         """Initialize the request handler with service dependencies"""
         try:
-            # Get the global agent orchestrator
-            self.agent_orchestrator = agent_orchestrator
-            
             # Register tool handlers
             self._register_tool_handlers()
             
@@ -42,9 +35,14 @@ class MCPRequestHandler:
             logger.info("MCP request handler initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize MCP request handler: {e}")
+            logger.error("Failed to initialize MCP request handler: %s", e)
             raise
     
+    @property
+    def agent_orchestrator(self):
+        """Agent orchestrator shared with the tool implementations; loads the LLM stack on first use"""
+        return mcp_tool_implementations._get_orchestrator()
+    
     def _register_tool_handlers(self) -> None:
         """Register handlers for each MCP tool"""
         try:
@@ -54,17 +52,16 @@ class MCPRequestHandler:
             # Register each tool handler
             for tool_name, handler_func in tool_implementations.items():
                 self.tool_registry.register_tool_handler(tool_name, handler_func)
-                logger.info(f"Registered MCP tool handler: {tool_name}")
             
-            logger.info(f"Registered {len(tool_implementations)} MCP tool handlers")
+            logger.info("Registered %s MCP tool handlers", len(tool_implementations))
             
         except Exception as e:
-            logger.error(f"Failed to register MCP tool handlers: {e}")
+            logger.error("Failed to register MCP tool handlers: %s", e)
             raise
     
     async def handle_tool_call(self, tool_name: str, parameters: Dict[str, Any]) -> MCPResponse:
         """Handle an MCP tool call request"""
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
         
         try:
             if not self.is_initialized:
@@ -73,24 +70,25 @@ class MCPRequestHandler:
                 return response
             
             # Log the request
-            logger.info(f"Handling MCP tool call: {tool_name} with parameters: {parameters}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Handling MCP tool call: %s with parameters: %s", tool_name, parameters)
             
             # Execute through tool registry
             result = await self.tool_registry.execute_tool(tool_name, parameters)
             
             # Calculate processing time
-            processing_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             
-            # Log MCP request to the same audit trail as REST API
+            # Log MCP request to the same audit trail as REST API; this only queues the entry
             await self._log_mcp_request(tool_name, parameters, result, processing_time_ms)
             
             return result
             
         except Exception as e:
-            processing_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-            logger.error(f"MCP tool call handling failed: {e}")
+            processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            logger.error("MCP tool call handling failed: %s", e)
             
-            # Log the error
+            # Queue the error log entry; the write is batched off the request path
             await logging_service.log_error(e, {
                 'context': 'mcp_tool_call',
                 'tool_name': tool_name,
@@ -102,41 +100,37 @@ class MCPRequestHandler:
             response.add_text_content(f"Tool call handling failed: {str(e)}")
             return response
     
-
-    
     async def _log_mcp_request(self, tool_name: str, parameters: Dict[str, Any], 
                               response: MCPResponse, processing_time_ms: int) -> None:
         """Log MCP request to the same audit trail as REST API"""
         try:
-            # Create MCP request log entry
-            mcp_log_context = {
-                'log_type': 'mcp_request',
-                'tool_name': tool_name,
-                'parameters': parameters,
-                'response_content_count': len(response.content),
-                'is_error': response.isError,
-                'processing_time_ms': processing_time_ms,
-                'timestamp': datetime.utcnow().isoformat()
-            }
-            
-            # Extract relevant data for analysis logging if it's an analyze_stock call
-            if tool_name == 'analyze_stock' and not response.isError:
-                # Try to extract analysis data from response content
-                analysis_data = None
-                for content_item in response.content:
-                    if content_item.get('type') == 'resource':
-                        resource = content_item.get('resource', {})
-                        if resource.get('mimeType') == 'application/json':
-                            try:
-                                import json
-                                analysis_data = json.loads(resource.get('text', '{}'))
-                                break
-                            except json.JSONDecodeError:
-                                pass
+            # Detailed request context is debug-only metadata; building it re-parses the response payload
+            if logger.isEnabledFor(logging.DEBUG):
+                mcp_log_context = {
+                    'log_type': 'mcp_request',
+                    'tool_name': tool_name,
+                    'parameters': parameters,
+                    'response_content_count': len(response.content),
+                    'is_error': response.isError,
+                    'processing_time_ms': processing_time_ms,
+                    'timestamp': utc_now_iso()
+                }
+                
+                # Reference the analysis produced by an analyze_stock call
+                if tool_name == 'analyze_stock' and not response.isError:
+                    for content_item in response.content:
+                        if content_item.get('type') == 'resource':
+                            resource = content_item.get('resource', {})
+                            if resource.get('mimeType') == 'application/json':
+                                try:
+                                    mcp_log_context['analysis_id'] = orjson.loads(resource.get('text', '{}')).get('analysis_id')
+                                    break
+                                except orjson.JSONDecodeError:
+                                    pass
                 
-                # Analysis data is logged via log_api_request below
+                logger.debug("MCP request context: %s", mcp_log_context)
             
-            # Always log the MCP request itself
+            # Always log the MCP request itself; the logging service batches the file write
             await logging_service.log_api_request(
                 endpoint=f"mcp://{tool_name}",
                 method="MCP_TOOL_CALL",
@@ -147,23 +141,31 @@ class MCPRequestHandler:
             )
             
         except Exception as e:
-            logger.error(f"Failed to log MCP request: {e}")
+            logger.error("Failed to log MCP request: %s", e)
             # Don't raise - logging failure shouldn't break the tool call
     
     async def cleanup(self) -> None:
         """Cleanup resources"""
         try:
             self.is_initialized = False
+            
+            await mcp_tool_implementations.shutdown()
+            
+            # Write the final audit and error entries before the loop goes away
+            await logging_service.flush()
+            
             logger.info("MCP request handler cleaned up")
         except Exception as e:
-            logger.error(f"MCP request handler cleanup failed: {e}")
+            logger.error("MCP request handler cleanup failed: %s", e)
     
     def get_handler_status(self) -> Dict[str, Any]:
         """Get status information about the request handler"""
         return {
             'service': 'MCPRequestHandler',
             'is_initialized': self.is_initialized,
-            'has_agent_orchestrator': self.agent_orchestrator is not None,
+            'has_agent_orchestrator': mcp_tool_implementations.agent_orchestrator is not None,
+            'agent_query_batching': mcp_tool_implementations.get_batching_stats(),
+            'log_batching': logging_service.get_batching_stats(),
             'registered_handlers': len(self.tool_registry._tool_handlers),
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': utc_now_iso()
         }
\ No newline at end of file
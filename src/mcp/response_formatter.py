@@ -8,6 +8,7 @@ from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 
 from .schemas import MCPResponse
+from src.models.timestamps import utc_now_iso
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +55,7 @@ class MCPResponseFormatter:
             return response
             
         except Exception as e:
-            logger.error(f"Failed to format analysis response: {e}")
+            logger.error("Failed to format analysis response: %s", e)
             error_response = MCPResponse(isError=True)
             error_response.add_text_content(f"Response formatting failed: {str(e)}")
             return error_response
@@ -87,7 +88,7 @@ class MCPResponseFormatter:
             return response
             
         except Exception as e:
-            logger.error(f"Failed to format market data response: {e}")
+            logger.error("Failed to format market data response: %s", e)
             error_response = MCPResponse(isError=True)
             error_response.add_text_content(f"Market data formatting failed: {str(e)}")
             return error_response
@@ -120,7 +121,7 @@ class MCPResponseFormatter:
             return response
             
         except Exception as e:
-            logger.error(f"Failed to format company resolution response: {e}")
+            logger.error("Failed to format company resolution response: %s", e)
             error_response = MCPResponse(isError=True)
             error_response.add_text_content(f"Company resolution formatting failed: {str(e)}")
             return error_response
@@ -139,7 +140,7 @@ class MCPResponseFormatter:
             return response
             
         except Exception as e:
-            logger.error(f"Failed to format error response: {e}")
+            logger.error("Failed to format error response: %s", e)
             # Fallback error response
             fallback_response = MCPResponse(isError=True)
             fallback_response.add_text_content(f"Error formatting failed: {str(e)}")
@@ -166,7 +167,7 @@ class MCPResponseFormatter:
             return response
             
         except Exception as e:
-            logger.error(f"Failed to format generic response: {e}")
+            logger.error("Failed to format generic response: %s", e)
             error_response = MCPResponse(isError=True)
             error_response.add_text_content(f"Generic response formatting failed: {str(e)}")
             return error_response
@@ -193,14 +194,14 @@ class MCPResponseFormatter:
             tools_data = {
                 'tool_count': tool_count,
                 'tools': tools,
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': utc_now_iso()
             }
             response.add_json_content(tools_data, uri)
             
             return response
             
         except Exception as e:
-            logger.error(f"Failed to format tool list response: {e}")
+            logger.error("Failed to format tool list response: %s", e)
             error_response = MCPResponse(isError=True)
             error_response.add_text_content(f"Tool list formatting failed: {str(e)}")
             return error_response
@@ -215,7 +216,7 @@ class MCPResponseFormatter:
             return response
             
         except Exception as e:
-            logger.error(f"Failed to add metadata to response: {e}")
+            logger.error("Failed to add metadata to response: %s", e)
             return response
     
     def validate_response_format(self, response: MCPResponse) -> bool:
@@ -247,7 +248,7 @@ class MCPResponseFormatter:
             return True
             
         except Exception as e:
-            logger.error(f"Response validation failed: {e}")
+            logger.error("Response validation failed: %s", e)
             return False
     
     def get_formatter_info(self) -> Dict[str, Any]:
@@ -256,5 +257,5 @@ class MCPResponseFormatter:
             'service': 'MCPResponseFormatter',
             'supported_content_types': list(self.default_mime_types.keys()),
             'mime_types': self.default_mime_types,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': utc_now_iso()
         }
\ No newline at end of file
@@ -6,9 +6,18 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 import json
+import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# Slotted dataclasses (smaller instances, faster attribute access) where supported
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class MCPToolSchema:
     """Schema definition for an MCP tool"""
     name: str
@@ -24,7 +33,7 @@ class MCPToolSchema:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MCPRequest:
     """MCP request structure"""
     method: str
@@ -41,7 +50,7 @@ class MCPRequest:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MCPResponse:
     """MCP response structure"""
     content: List[Dict[str, Any]] = field(default_factory=list)
@@ -67,7 +76,12 @@ class MCPResponse:
     
     def add_json_content(self, data: Dict[str, Any], uri: str = None) -> None:
         """Add JSON data as resource content"""
-        json_text = json.dumps(data, indent=2, default=str)
+        if orjson is not None:
+            json_text = orjson.dumps(
+                data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        else:
+            json_text = json.dumps(data, indent=2, default=str)
         uri = uri or f"analysis://{data.get('ticker', 'unknown')}/{datetime.utcnow().strftime('%Y-%m-%d')}"
         self.add_resource_content(uri, "application/json", json_text)
     
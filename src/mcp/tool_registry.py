@@ -2,19 +2,42 @@
 MCP Tool Registry for managing available tools and their schemas
 """
 
+import copy
 import logging
-from typing import Dict, List, Optional, Any, Callable
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from .schemas import MCPToolSchema, DEFAULT_MCP_TOOLS, MCPResponse
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 logger = logging.getLogger(__name__)
 
+# JSON Schema type -> (Python types, description) for the fallback validator
+_BASIC_TYPE_CHECKS: Dict[str, Tuple[Tuple[type, ...], str]] = {
+    'string': ((str,), 'a string'),
+    'boolean': ((bool,), 'a boolean'),
+    'number': ((int, float), 'a number')
+}
+
 
 class MCPToolRegistry:
     """Registry for managing MCP tools and their execution"""
     
+    __slots__ = ('_tools', '_tool_handlers', '_validators', '_tool_dicts', '_registry_info_cache',
+                 '_schema_check_cache', '_cached_validation', '_version')
+    
     def __init__(self):
         self._tools: Dict[str, MCPToolSchema] = {}
         self._tool_handlers: Dict[str, Callable] = {}
+        self._validators: Dict[str, Callable] = {}
+        self._tool_dicts: Dict[str, Dict[str, Any]] = {}
+        self._registry_info_cache: Optional[Dict[str, Any]] = None
+        self._schema_check_cache: Optional[Dict[str, Any]] = None
+        self._cached_validation = lru_cache(maxsize=1024)(self._validate_parameter_items)
+        self._version = 0
         self._initialize_default_tools()
     
     def _initialize_default_tools(self) -> None:
@@ -22,16 +45,32 @@ class MCPToolRegistry:
         for tool in DEFAULT_MCP_TOOLS:
             self.register_tool(tool)
         
-        logger.info(f"Initialized MCP tool registry with {len(self._tools)} default tools")
+        logger.info("Initialized MCP tool registry with %s default tools", len(self._tools))
     
     def register_tool(self, tool_schema: MCPToolSchema, handler: Optional[Callable] = None) -> None:
         """Register a new MCP tool"""
         self._tools[tool_schema.name] = tool_schema
+        self._tool_dicts[tool_schema.name] = tool_schema.to_dict()
+        self._compile_validator(tool_schema)
         
         if handler:
             self._tool_handlers[tool_schema.name] = handler
         
-        logger.info(f"Registered MCP tool: {tool_schema.name}")
+        self._invalidate_caches()
+        logger.debug("Registered MCP tool: %s", tool_schema.name)
+    
+    def _compile_validator(self, tool_schema: MCPToolSchema) -> None:
+        """Precompile the tool's parameter schema into a validator function"""
+        self._validators.pop(tool_schema.name, None)
+        
+        if fastjsonschema is None:
+            return
+        
+        try:
+            # Without default injection the handler sees the same parameters as with the basic checks
+            self._validators[tool_schema.name] = fastjsonschema.compile(tool_schema.parameters, use_default=False)
+        except Exception as e:
+            logger.warning("Could not compile schema for MCP tool '%s', using basic validation: %s", tool_schema.name, e)
     
     def register_tool_handler(self, tool_name: str, handler: Callable) -> None:
         """Register a handler for a specific tool"""
@@ -39,7 +78,8 @@ class MCPToolRegistry:
             raise ValueError(f"Tool '{tool_name}' not found in registry")
         
         self._tool_handlers[tool_name] = handler
-        logger.info(f"Registered handler for MCP tool: {tool_name}")
+        self._invalidate_caches()
+        logger.debug("Registered handler for MCP tool: %s", tool_name)
     
     def get_tool_schema(self, tool_name: str) -> Optional[MCPToolSchema]:
         """Get schema for a specific tool"""
@@ -53,6 +93,16 @@ class MCPToolRegistry:
         """Get list of all registered tool names"""
         return list(self._tools.keys())
     
+    @property
+    def tool_count(self) -> int:
+        """Number of registered tools"""
+        return len(self._tools)
+    
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever tools or handlers change, for callers caching derived views"""
+        return self._version
+    
     def has_tool(self, tool_name: str) -> bool:
         """Check if a tool is registered"""
         return tool_name in self._tools
@@ -65,30 +115,38 @@ class MCPToolRegistry:
         """Execute a tool with given parameters"""
         try:
             # Validate tool exists
-            if not self.has_tool(tool_name):
+            tool_schema = self._tools.get(tool_name)
+            if tool_schema is None:
                 response = MCPResponse(isError=True)
                 response.add_text_content(f"Tool '{tool_name}' not found in registry")
                 return response
             
             # Validate handler exists
-            if not self.has_handler(tool_name):
+            handler = self._tool_handlers.get(tool_name)
+            if handler is None:
                 response = MCPResponse(isError=True)
                 response.add_text_content(f"No handler registered for tool '{tool_name}'")
                 return response
             
-            # Get tool schema and handler
-            tool_schema = self._tools[tool_name]
-            handler = self._tool_handlers[tool_name]
-            
-            # Validate parameters against schema
-            validation_error = self._validate_parameters(tool_schema, parameters)
+            # Validate parameters against schema; compiled validators are cheaper than a cache lookup,
+            # the interpreted fallback reuses results for repeated inputs
+            if tool_name in self._validators:
+                validation_error = self._validate_parameters(tool_schema, parameters)
+            else:
+                try:
+                    param_items = tuple(sorted((name, type(value), value) for name, value in parameters.items()))
+                    validation_error = self._cached_validation(tool_name, param_items)
+                except TypeError:
+                    # Unhashable (nested) parameter values
+                    validation_error = self._validate_parameters(tool_schema, parameters)
             if validation_error:
                 response = MCPResponse(isError=True)
                 response.add_text_content(f"Parameter validation failed: {validation_error}")
                 return response
             
             # Execute the tool handler
-            logger.info(f"Executing MCP tool: {tool_name} with parameters: {parameters}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Executing MCP tool: %s with parameters: %s", tool_name, parameters)
             result = await handler(parameters)
             
             # Ensure result is an MCPResponse
@@ -104,62 +162,122 @@ class MCPToolRegistry:
             return result
             
         except Exception as e:
-            logger.error(f"Tool execution failed for '{tool_name}': {e}")
+            logger.error("Tool execution failed for '%s': %s", tool_name, e)
             response = MCPResponse(isError=True)
             response.add_text_content(f"Tool execution failed: {str(e)}")
             return response
     
+    def _validate_parameter_items(self, tool_name: str, param_items: Tuple[Tuple[str, type, Any], ...]) -> Optional[str]:
+        """Validate a hashable parameter snapshot; wrapped in an LRU cache per registry"""
+        return self._validate_parameters(
+            self._tools[tool_name],
+            {name: value for name, _, value in param_items}
+        )
+    
     def _validate_parameters(self, tool_schema: MCPToolSchema, parameters: Dict[str, Any]) -> Optional[str]:
         """Validate parameters against tool schema"""
+        validator = self._validators.get(tool_schema.name)
+        if validator is not None:
+            try:
+                validator(parameters)
+                return None
+            except fastjsonschema.JsonSchemaException as e:
+                # Report the basic checks' messages; the schema's own message only covers
+                # constraints those checks do not know about
+                return self._check_basic_parameters(tool_schema, parameters) or e.message
+        
+        return self._check_basic_parameters(tool_schema, parameters)
+    
+    def _check_basic_parameters(self, tool_schema: MCPToolSchema, parameters: Dict[str, Any]) -> Optional[str]:
+        """Check required parameters and basic property types"""
         try:
-            schema = tool_schema.parameters
+            schema: Dict[str, Any] = tool_schema.parameters
             
             # Check required parameters
-            required = schema.get('required', [])
+            required: List[str] = schema.get('required', [])
             for param in required:
                 if param not in parameters:
                     return f"Missing required parameter: {param}"
             
             # Basic type validation for properties
-            properties = schema.get('properties', {})
+            properties: Dict[str, Any] = schema.get('properties', {})
             for param_name, param_value in parameters.items():
-                if param_name in properties:
-                    expected_type = properties[param_name].get('type')
-                    
-                    if expected_type == 'string' and not isinstance(param_value, str):
-                        return f"Parameter '{param_name}' must be a string"
-                    elif expected_type == 'boolean' and not isinstance(param_value, bool):
-                        return f"Parameter '{param_name}' must be a boolean"
-                    elif expected_type == 'number' and not isinstance(param_value, (int, float)):
-                        return f"Parameter '{param_name}' must be a number"
+                param_schema = properties.get(param_name)
+                if param_schema is None:
+                    continue
+                
+                type_check = _BASIC_TYPE_CHECKS.get(param_schema.get('type'))
+                if type_check is not None and not isinstance(param_value, type_check[0]):
+                    return f"Parameter '{param_name}' must be {type_check[1]}"
             
             return None  # No validation errors
             
         except Exception as e:
             return f"Parameter validation error: {str(e)}"
     
+    def _invalidate_caches(self) -> None:
+        """Drop derived views after the set of tools or handlers changes"""
+        self._version += 1
+        self._registry_info_cache = None
+        self._schema_check_cache = None
+        self._cached_validation.cache_clear()
+    
+    # The getters below return deep copies so callers cannot alter the cached views
+    
     def get_registry_info(self) -> Dict[str, Any]:
         """Get information about the tool registry"""
-        return {
-            'total_tools': len(self._tools),
-            'tools_with_handlers': len(self._tool_handlers),
-            'available_tools': [
-                {
-                    'name': tool.name,
-                    'description': tool.description,
-                    'has_handler': tool.name in self._tool_handlers
-                }
-                for tool in self._tools.values()
-            ]
-        }
+        if self._registry_info_cache is None:
+            self._registry_info_cache = {
+                'total_tools': len(self._tools),
+                'tools_with_handlers': len(self._tool_handlers),
+                'available_tools': [
+                    {
+                        'name': tool.name,
+                        'description': tool.description,
+                        'has_handler': tool.name in self._tool_handlers
+                    }
+                    for tool in self._tools.values()
+                ]
+            }
+        
+        return copy.deepcopy(self._registry_info_cache)
+    
+    def check_tool_schemas(self) -> Dict[str, Any]:
+        """Check that every registered tool schema is complete; recomputed only when tools change"""
+        if self._schema_check_cache is None:
+            valid_tools = []
+            invalid_tools = []
+            
+            for tool_schema in self._tools.values():
+                if (tool_schema.name and 
+                    tool_schema.description and 
+                    isinstance(tool_schema.parameters, dict)):
+                    valid_tools.append(tool_schema.name)
+                else:
+                    invalid_tools.append({
+                        'name': tool_schema.name,
+                        'error': 'Missing required fields or invalid parameters'
+                    })
+            
+            self._schema_check_cache = {
+                'valid_tools': valid_tools,
+                'invalid_tools': invalid_tools,
+                'total_tools': len(self._tools)
+            }
+            logger.info("Tool schema validation: %s valid, %s invalid", len(valid_tools), len(invalid_tools))
+        
+        return copy.deepcopy(self._schema_check_cache)
     
     def unregister_tool(self, tool_name: str) -> bool:
         """Unregister a tool from the registry"""
         if tool_name in self._tools:
             del self._tools[tool_name]
+            self._validators.pop(tool_name, None)
+            self._tool_dicts.pop(tool_name, None)
             if tool_name in self._tool_handlers:
                 del self._tool_handlers[tool_name]
-            logger.info(f"Unregistered MCP tool: {tool_name}")
+            self._invalidate_caches()
+            logger.info("Unregistered MCP tool: %s", tool_name)
             return True
         return False
     
@@ -167,11 +285,14 @@ class MCPToolRegistry:
         """Clear all tools from the registry"""
         self._tools.clear()
         self._tool_handlers.clear()
+        self._validators.clear()
+        self._tool_dicts.clear()
+        self._invalidate_caches()
         logger.info("Cleared MCP tool registry")
     
     def list_tools_for_mcp(self) -> List[Dict[str, Any]]:
         """Get tool list in MCP protocol format"""
-        return [tool.to_dict() for tool in self._tools.values()]
+        return copy.deepcopy(list(self._tool_dicts.values()))
 
 
 # Global tool registry instance
@@ -2,31 +2,103 @@
 MCP Tool implementations that integrate with existing Langchain agent services
 """
 
+import asyncio
+import copy
+import itertools
 import logging
+import time
 from typing import Dict, Any, Optional
-from datetime import datetime
 import json
 
 from .schemas import MCPResponse
 from .response_formatter import MCPResponseFormatter
+from .query_batcher import AgentQueryBatcher
 
-# Use absolute imports to avoid circular import issues
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from agents.stock_analysis_agent import agent_orchestrator
-from services.logging_service import logging_service
+from src.models.timestamps import utc_now_iso
+from src.services.cache_service import global_cache
+from src.services.nlp_service import nlp_service
 
 logger = logging.getLogger(__name__)
 
+# Company name -> ticker mappings are effectively static
+COMPANY_RESOLUTION_CACHE_TTL = 86400
+
+# Request ids: process start time plus a counter, unique per call even within the same second
+_REQUEST_ID_EPOCH = int(time.time())
+_request_id_counter = itertools.count(1)
+
+# How long successful agent results are reused, per tool (seconds)
+AGENT_RESULT_CACHE_TTL = {
+    'analyze_stock': 300,
+    'get_market_data': 60
+}
+
 
 class MCPToolImplementations:
     """Implementation of MCP tools that integrate with existing services"""
     
+    __slots__ = ('response_formatter', 'agent_orchestrator', '_batcher')
+    
     def __init__(self):
         self.response_formatter = MCPResponseFormatter()
-        self.agent_orchestrator = agent_orchestrator
+        self.agent_orchestrator = None  # Imported lazily on first tool call
+        # Single-flight for agent runs: identical in-flight queries share one run
+        self._batcher = AgentQueryBatcher(self._run_agent_query)
+    
+    def _get_orchestrator(self):
+        """Import the agent orchestrator on first use; it pulls in the LLM client stack"""
+        if self.agent_orchestrator is None:
+            from src.agents.stock_analysis_agent import agent_orchestrator
+            self.agent_orchestrator = agent_orchestrator
+        return self.agent_orchestrator
+    
+    def _run_agent_query(self, query: str):
+        """Start an agent analysis for a single query"""
+        return self._get_orchestrator().stock_agent.analyze_stock_query(query)
+    
+    async def _query_agent(self, tool_name: str, params_key: tuple, query: str,
+                           prefetch_ticker: Optional[str] = None) -> Dict[str, Any]:
+        """Run an agent query, reusing recent successful results and sharing identical in-flight runs.
+
+        The result may be shared with other callers, so each caller gets its own copy.
+        """
+        cache_key = global_cache._generate_key("agent_result", tool_name, params_key)
+        
+        agent_result = await global_cache.get(cache_key)
+        if agent_result is None:
+            # Shielded: a caller that gives up must not cancel the run other callers are waiting on
+            agent_result = await asyncio.shield(self._batcher.run(
+                cache_key, self._run_and_cache, tool_name, cache_key, query, prefetch_ticker
+            ))
+        
+        return copy.deepcopy(agent_result)
+    
+    async def _run_and_cache(self, tool_name: str, cache_key: str, query: str,
+                             prefetch_ticker: Optional[str]) -> Dict[str, Any]:
+        """Run one agent query and cache a successful result"""
+        if prefetch_ticker:
+            # The agent's first tool call fetches this ticker's market data; start it now
+            from src.services.market_data_service import market_data_service
+            market_data_service.prefetch_stock_data(prefetch_ticker)
+        
+        agent_result = await self._run_agent_query(query)
+        
+        if agent_result.get('success', False):
+            await global_cache.set(cache_key, agent_result, ttl_seconds=AGENT_RESULT_CACHE_TTL[tool_name])
+        
+        return agent_result
+    
+    async def invalidate_cached_result(self, tool_name: str, params_key: tuple) -> bool:
+        """Drop a cached agent result so the next call re-runs the agent"""
+        return await global_cache.delete(global_cache._generate_key("agent_result", tool_name, params_key))
+    
+    async def shutdown(self) -> None:
+        """Stop in-flight agent queries"""
+        await self._batcher.shutdown()
+    
+    def get_batching_stats(self) -> Dict[str, Any]:
+        """Get agent query coalescing statistics"""
+        return self._batcher.get_stats()
     
     async def analyze_stock_tool(self, parameters: Dict[str, Any]) -> MCPResponse:
         """
@@ -41,50 +113,66 @@ class MCPToolImplementations:
                     "Missing required parameter: company_name_or_ticker"
                 )
             
-            logger.info(f"MCP analyze_stock tool called for: {company_name_or_ticker}")
+            logger.debug("MCP analyze_stock tool called for: %s", company_name_or_ticker)
+            
+            # Key analyses by ticker when the input is a known company, so 'Apple' and 'AAPL' share results
+            known_ticker = nlp_service.company_resolver.lookup_exact_ticker(company_name_or_ticker)
             
             # Use the existing Langchain agent to perform analysis
-            agent_result = await self.agent_orchestrator.stock_agent.analyze_stock_query(
-                f"Analyze {company_name_or_ticker} stock and provide investment recommendations"
+            agent_result = await self._query_agent(
+                'analyze_stock',
+                (known_ticker or company_name_or_ticker.strip().lower(),),
+                f"Analyze {company_name_or_ticker} stock and provide investment recommendations",
+                prefetch_ticker=known_ticker
             )
             
-            if agent_result.get('success', False):
+            result_get = agent_result.get  # bound once, read many times below
+            processing_time_ms = result_get('processing_time_ms', 0)
+            
+            if result_get('success', False):
+                extracted_data = result_get('extracted_data') or {}
+                # The agent result may be cached or shared between calls; the analysis id names the
+                # logged analysis, the request id tells individual tool calls apart
+                request_id = f"mcp_{_REQUEST_ID_EPOCH}_{next(_request_id_counter)}"
+                analysis_id = (extracted_data.get('investment_analysis') or {}).get('analysis_id') or request_id
+                
                 # Format successful analysis response
                 analysis_data = {
                     'tool_call': 'analyze_stock',
                     'input': company_name_or_ticker,
-                    'ticker': agent_result.get('ticker', 'unknown'),
-                    'company_name': agent_result.get('company_name', 'unknown'),
-                    'recommendation': agent_result.get('recommendation', 'Hold'),
-                    'confidence_score': agent_result.get('confidence_score', 50.0),
-                    'current_price': agent_result.get('current_price', 0.0),
-                    'price_change_percentage': agent_result.get('price_change_percentage', 0.0),
-                    'reasoning': agent_result.get('response', ''),
-                    'processing_time_ms': agent_result.get('processing_time_ms', 0),
-                    'timestamp': agent_result.get('timestamp', datetime.utcnow().isoformat()),
-                    'extracted_data': agent_result.get('extracted_data', {}),
-                    'analysis_id': agent_result.get('extracted_data', {}).get('investment_analysis', {}).get('analysis_id', f"mcp_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}")
+                    'ticker': result_get('ticker', 'unknown'),
+                    'company_name': result_get('company_name', 'unknown'),
+                    'recommendation': result_get('recommendation', 'Hold'),
+                    'confidence_score': result_get('confidence_score', 50.0),
+                    'current_price': result_get('current_price', 0.0),
+                    'price_change_percentage': result_get('price_change_percentage', 0.0),
+                    'reasoning': result_get('response', ''),
+                    'processing_time_ms': processing_time_ms,
+                    'timestamp': result_get('timestamp') or utc_now_iso(),
+                    'extracted_data': extracted_data,
+                    'analysis_id': analysis_id,
+                    'request_id': request_id
                 }
                 
                 return self.response_formatter.format_analysis_response(analysis_data)
             
             else:
                 # Format error response
-                error_msg = agent_result.get('error', 'Analysis failed')
-                suggestions = agent_result.get('suggestions', [])
+                error_msg = result_get('error', 'Analysis failed')
+                suggestions = result_get('suggestions', [])
                 
                 error_details = {
                     'tool_call': 'analyze_stock',
                     'input': company_name_or_ticker,
                     'error': error_msg,
                     'suggestions': suggestions,
-                    'processing_time_ms': agent_result.get('processing_time_ms', 0)
+                    'processing_time_ms': processing_time_ms
                 }
                 
                 return self.response_formatter.format_error_response(error_msg, error_details)
                 
         except Exception as e:
-            logger.error(f"MCP analyze_stock tool failed: {e}")
+            logger.error("MCP analyze_stock tool failed: %s", e)
             return self.response_formatter.format_error_response(
                 f"Stock analysis failed: {str(e)}",
                 {'tool_call': 'analyze_stock', 'input': parameters.get('company_name_or_ticker', 'unknown')}
@@ -104,7 +192,7 @@ class MCPToolImplementations:
                     "Missing required parameter: ticker"
                 )
             
-            logger.info(f"MCP get_market_data tool called for: {ticker}")
+            logger.debug("MCP get_market_data tool called for: %s", ticker)
             
             # Construct query for the agent
             query = f"Get current market data for {ticker}"
@@ -114,12 +202,17 @@ class MCPToolImplementations:
                 query += " current data only"
             
             # Use the Langchain agent to fetch market data
-            agent_result = await self.agent_orchestrator.stock_agent.analyze_stock_query(query)
+            agent_result = await self._query_agent(
+                'get_market_data', (ticker.strip().upper(), bool(include_historical)), query,
+                prefetch_ticker=ticker.strip().upper()
+            )
+            result_get = agent_result.get
+            processing_time_ms = result_get('processing_time_ms', 0)
             
-            if agent_result.get('success', False):
+            if result_get('success', False):
                 # Extract market data from agent result
-                extracted_data = agent_result.get('extracted_data', {})
-                market_data = extracted_data.get('market_data', {})
+                extracted_data = result_get('extracted_data') or {}
+                market_data = extracted_data.get('market_data') or {}
                 
                 if market_data:
                     # Enhance market data with metadata
@@ -128,8 +221,8 @@ class MCPToolImplementations:
                         'ticker': ticker,
                         'include_historical': include_historical,
                         'data': market_data,
-                        'timestamp': datetime.utcnow().isoformat(),
-                        'processing_time_ms': agent_result.get('processing_time_ms', 0)
+                        'timestamp': utc_now_iso(),
+                        'processing_time_ms': processing_time_ms
                     }
                     
                     return self.response_formatter.format_market_data_response(enhanced_market_data)
@@ -138,30 +231,30 @@ class MCPToolImplementations:
                     market_data = {
                         'tool_call': 'get_market_data',
                         'ticker': ticker,
-                        'current_price': agent_result.get('current_price', 0.0),
-                        'price_change_percentage': agent_result.get('price_change_percentage', 0.0),
-                        'company_name': agent_result.get('company_name', 'unknown'),
-                        'timestamp': datetime.utcnow().isoformat(),
-                        'processing_time_ms': agent_result.get('processing_time_ms', 0),
+                        'current_price': result_get('current_price', 0.0),
+                        'price_change_percentage': result_get('price_change_percentage', 0.0),
+                        'company_name': result_get('company_name', 'unknown'),
+                        'timestamp': utc_now_iso(),
+                        'processing_time_ms': processing_time_ms,
                         'note': 'Data extracted from general analysis response'
                     }
                     
                     return self.response_formatter.format_market_data_response(market_data)
             
             else:
-                error_msg = agent_result.get('error', f'Failed to retrieve market data for {ticker}')
+                error_msg = result_get('error', f'Failed to retrieve market data for {ticker}')
                 error_details = {
                     'tool_call': 'get_market_data',
                     'ticker': ticker,
                     'include_historical': include_historical,
                     'error': error_msg,
-                    'processing_time_ms': agent_result.get('processing_time_ms', 0)
+                    'processing_time_ms': processing_time_ms
                 }
                 
                 return self.response_formatter.format_error_response(error_msg, error_details)
                 
         except Exception as e:
-            logger.error(f"MCP get_market_data tool failed: {e}")
+            logger.error("MCP get_market_data tool failed: %s", e)
             return self.response_formatter.format_error_response(
                 f"Market data retrieval failed: {str(e)}",
                 {'tool_call': 'get_market_data', 'ticker': parameters.get('ticker', 'unknown')}
@@ -180,16 +273,47 @@ class MCPToolImplementations:
                     "Missing required parameter: company_name"
                 )
             
-            logger.info(f"MCP resolve_company_name tool called for: {company_name}")
+            logger.debug("MCP resolve_company_name tool called for: %s", company_name)
+
+            # Exact matches against the local company database need no agent round trip
+            known_ticker = nlp_service.company_resolver.lookup_exact_ticker(company_name)
+            if known_ticker:
+                company_info = await nlp_service.company_resolver.get_company_info(known_ticker)
+                return self.response_formatter.format_company_resolution_response({
+                    'tool_call': 'resolve_company_name',
+                    'input_name': company_name,
+                    'ticker': known_ticker,
+                    'resolved_company_name': company_info['name'] if company_info else company_name,
+                    'confidence': 1.0,
+                    'timestamp': utc_now_iso(),
+                    'processing_time_ms': 0,
+                    'note': 'Resolved from local company database'
+                })
+
+            cache_key = global_cache._generate_key("company_resolution", company_name.strip().lower())
+            cached_resolution = await global_cache.get(cache_key)
+            if cached_resolution:
+                resolution_data = dict(cached_resolution)
+                resolution_data['input_name'] = company_name
+                resolution_data['timestamp'] = utc_now_iso()
+                resolution_data['processing_time_ms'] = 0
+                resolution_data['from_cache'] = True
+                return self.response_formatter.format_company_resolution_response(resolution_data)
             
             # Use the Langchain agent to resolve company name
             query = f"What is the ticker symbol for {company_name}? Just resolve the company name to ticker."
-            agent_result = await self.agent_orchestrator.stock_agent.analyze_stock_query(query)
             
-            if agent_result.get('success', False):
+            # Identical resolutions arriving while the agent is still working share its result
+            agent_result = await asyncio.shield(
+                self._batcher.run(cache_key, self._run_agent_query, query)
+            )
+            result_get = agent_result.get
+            processing_time_ms = result_get('processing_time_ms', 0)
+            
+            if result_get('success', False):
                 # Extract company resolution data
-                extracted_data = agent_result.get('extracted_data', {})
-                company_resolution = extracted_data.get('company_resolution', {})
+                extracted_data = result_get('extracted_data') or {}
+                company_resolution = extracted_data.get('company_resolution') or {}
                 
                 if company_resolution:
                     resolution_data = {
@@ -198,13 +322,13 @@ class MCPToolImplementations:
                         'ticker': company_resolution.get('ticker', 'unknown'),
                         'resolved_company_name': company_resolution.get('company_name', company_name),
                         'confidence': company_resolution.get('confidence', 1.0),
-                        'timestamp': datetime.utcnow().isoformat(),
-                        'processing_time_ms': agent_result.get('processing_time_ms', 0)
+                        'timestamp': utc_now_iso(),
+                        'processing_time_ms': processing_time_ms
                     }
                 else:
                     # Try to extract from general response
-                    ticker = agent_result.get('ticker', 'unknown')
-                    resolved_name = agent_result.get('company_name', company_name)
+                    ticker = result_get('ticker', 'unknown')
+                    resolved_name = result_get('company_name', company_name)
                     
                     resolution_data = {
                         'tool_call': 'resolve_company_name',
@@ -212,27 +336,30 @@ class MCPToolImplementations:
                         'ticker': ticker,
                         'resolved_company_name': resolved_name,
                         'confidence': 0.8 if ticker != 'unknown' else 0.0,
-                        'timestamp': datetime.utcnow().isoformat(),
-                        'processing_time_ms': agent_result.get('processing_time_ms', 0),
+                        'timestamp': utc_now_iso(),
+                        'processing_time_ms': processing_time_ms,
                         'note': 'Extracted from general analysis response'
                     }
                 
+                if resolution_data['ticker'] != 'unknown':
+                    await global_cache.set(cache_key, resolution_data, ttl_seconds=COMPANY_RESOLUTION_CACHE_TTL)
+                
                 return self.response_formatter.format_company_resolution_response(resolution_data)
             
             else:
-                error_msg = agent_result.get('error', f'Failed to resolve company name: {company_name}')
+                error_msg = result_get('error', f'Failed to resolve company name: {company_name}')
                 error_details = {
                     'tool_call': 'resolve_company_name',
                     'input_name': company_name,
                     'error': error_msg,
-                    'suggestions': agent_result.get('suggestions', []),
-                    'processing_time_ms': agent_result.get('processing_time_ms', 0)
+                    'suggestions': result_get('suggestions', []),
+                    'processing_time_ms': processing_time_ms
                 }
                 
                 return self.response_formatter.format_error_response(error_msg, error_details)
                 
         except Exception as e:
-            logger.error(f"MCP resolve_company_name tool failed: {e}")
+            logger.error("MCP resolve_company_name tool failed: %s", e)
             return self.response_formatter.format_error_response(
                 f"Company name resolution failed: {str(e)}",
                 {'tool_call': 'resolve_company_name', 'input_name': parameters.get('company_name', 'unknown')}
@@ -7,6 +7,8 @@ from typing import Dict, Any, Optional
 from pydantic import BaseModel, Field
 import uuid
 
+from .timestamps import utc_now
+
 
 @dataclass
 class AnalysisLogEntry:
@@ -18,8 +20,8 @@ class AnalysisLogEntry:
     recommendation: str
     confidence_score: float
     processing_time_ms: int
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    expires_at: datetime = field(default_factory=lambda: datetime.utcnow() + timedelta(days=30))
+    timestamp: datetime = field(default_factory=utc_now)
+    expires_at: datetime = field(default_factory=lambda: utc_now() + timedelta(days=30))
     
     def __post_init__(self):
         """Validate log entry"""
@@ -61,8 +63,8 @@ class ErrorLogEntry:
     error_message: str = ""
     stack_trace: Optional[str] = None
     context: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    expires_at: datetime = field(default_factory=lambda: datetime.utcnow() + timedelta(days=30))
+    timestamp: datetime = field(default_factory=utc_now)
+    expires_at: datetime = field(default_factory=lambda: utc_now() + timedelta(days=30))
     
     def __post_init__(self):
         """Validate error log entry"""
@@ -102,7 +104,7 @@ class LogQueryResponse(BaseModel):
     """Response model for log queries"""
     total_count: int
     entries: list
-    query_timestamp: datetime = Field(default_factory=datetime.utcnow)
+    query_timestamp: datetime = Field(default_factory=utc_now)
     
     class Config:
         json_encoders = {
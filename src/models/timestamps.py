@@ -0,0 +1,24 @@
+"""
+Timestamp helpers shared by the API, MCP and logging layers
+"""
+import time
+from datetime import datetime, timezone
+
+
+def utc_now() -> datetime:
+    """Current time as a timezone-aware UTC datetime"""
+    return datetime.now(timezone.utc)
+
+
+_iso_timestamp_cache = (0, "")
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string with milliseconds and offset, formatted once per millisecond"""
+    global _iso_timestamp_cache
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms != _iso_timestamp_cache[0]:
+        seconds, millis = divmod(now_ms, 1000)
+        now = datetime.fromtimestamp(seconds, timezone.utc).replace(microsecond=millis * 1000)
+        _iso_timestamp_cache = (now_ms, now.isoformat(timespec="milliseconds"))
+    return _iso_timestamp_cache[1]
@@ -5,6 +5,7 @@ Manages A2A server lifecycle, registry registration, and integration with NANDA
 """
 
 import logging
+import random
 import threading
 import time
 import requests
@@ -198,10 +199,11 @@ class NESTAdapter:
             except Exception as e:
                 logger.warning(f"⚠️ [NESTAdapter] Registration attempt {attempt} failed: {e}")
             
-            # Retry with exponential backoff
+            # Retry with exponential backoff, jittered so restarted agents don't hit the registry together
             if attempt < max_retries:
-                logger.info(f"⏳ [NESTAdapter] Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
+                delay = random.uniform(retry_delay / 2, retry_delay)
+                logger.info(f"⏳ [NESTAdapter] Retrying in {delay:.2f} seconds...")
+                time.sleep(delay)
                 retry_delay *= 2  # Exponential backoff
         
         # All retries failed
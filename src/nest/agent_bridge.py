@@ -7,7 +7,7 @@ Implements A2AServer interface from python_a2a library for agent-to-agent commun
 import logging
 import uuid
 import requests
-from typing import Optional, Callable
+from typing import Dict, Optional, Callable
 from python_a2a import A2AServer, A2AClient, Message, TextContent, MessageRole
 
 from .agent_logic import process_a2a_message_sync
@@ -44,6 +44,11 @@ class StockAgentBridge(A2AServer):
         self.agent_logic = agent_logic or process_a2a_message_sync
         self.registry_url = registry_url
         
+        # Keep-alive session for registry lookups, and one A2A client per peer endpoint;
+        # constructing an A2AClient fetches the peer's agent card, so it is done once per URL
+        self._http = requests.Session()
+        self._agent_clients: Dict[str, A2AClient] = {}
+        
         logger.info(f"🤖 [StockAgentBridge] Initialized with agent_id: {agent_id}")
         logger.info(f"🌐 [StockAgentBridge] Registry URL: {registry_url}")
     
@@ -222,7 +227,7 @@ class StockAgentBridge(A2AServer):
             lookup_url = f"{self.registry_url}/lookup/{agent_id}"
             logger.info(f"🌐 [{self.agent_id}] Looking up {agent_id} at {lookup_url}")
             
-            response = requests.get(lookup_url, timeout=10)
+            response = self._http.get(lookup_url, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -263,8 +268,10 @@ class StockAgentBridge(A2AServer):
             
             logger.info(f"📤 [{self.agent_id}] → [{target_agent_id}]: {message_text[:50]}...")
             
-            # Create A2A client and send message
-            client = A2AClient(agent_url, timeout=30)
+            # Reuse the A2A client for this endpoint and send message
+            client = self._agent_clients.get(agent_url)
+            if client is None:
+                client = self._agent_clients.setdefault(agent_url, A2AClient(agent_url, timeout=30))
             response = client.send_message(
                 Message(
                     role=MessageRole.USER,
@@ -44,12 +44,7 @@ async def process_a2a_message(message: str, conversation_id: str) -> str:
         return f"Sorry, I encountered an error processing your request: {str(e)}"
 
 
-async def _handle_command(command: str, conversation_id: str) -> str:
-    """Handle system commands"""
-    cmd = command.split()[0] if command else ""
-    
-    if cmd == "/help" or cmd == "/info":
-        return """NASDAQ Stock Agent - Available Commands:
+HELP_TEXT = """NASDAQ Stock Agent - Available Commands:
 
 📊 Stock Analysis:
    Just send a ticker symbol or company name:
@@ -74,17 +69,13 @@ I provide:
 ✓ Investment recommendations (Buy/Hold/Sell)
 ✓ Confidence scores and risk assessment
 ✓ Detailed reasoning for recommendations"""
-    
-    elif cmd == "/ping":
-        return "Pong! NASDAQ Stock Agent is online and ready to analyze stocks."
-    
-    elif cmd == "/status":
-        return f"""NASDAQ Stock Agent Status:
+
+STATUS_TEMPLATE = """NASDAQ Stock Agent Status:
 🟢 Status: Online and operational
 🤖 Agent ID: nasdaq-stock-agent
 📊 Domain: Financial Analysis
 🎯 Specialization: NASDAQ Stock Analysis
-⏰ Timestamp: {datetime.utcnow().isoformat()}
+⏰ Timestamp: {timestamp}
 
 Services:
 ✓ Market Data Service: Active
@@ -93,9 +84,8 @@ Services:
 ✓ Claude AI: Active
 
 Ready to analyze NASDAQ stocks!"""
-    
-    elif cmd == "/capabilities":
-        return """NASDAQ Stock Agent Capabilities:
+
+CAPABILITIES_TEXT = """NASDAQ Stock Agent Capabilities:
 
 📈 Stock Analysis:
    - Real-time NASDAQ market data retrieval
@@ -118,9 +108,32 @@ Ready to analyze NASDAQ stocks!"""
    - A2A protocol support
    - REST API interface
    - Agent-to-agent forwarding"""
+
+
+def _status_text() -> str:
+    """Render the status message with the current timestamp"""
+    return STATUS_TEMPLATE.format(timestamp=datetime.utcnow().isoformat())
+
+
+# Command name -> response builder, resolved with a single dict lookup
+_COMMAND_HANDLERS = {
+    "/help": lambda: HELP_TEXT,
+    "/info": lambda: HELP_TEXT,
+    "/ping": lambda: "Pong! NASDAQ Stock Agent is online and ready to analyze stocks.",
+    "/status": _status_text,
+    "/capabilities": lambda: CAPABILITIES_TEXT,
+}
+
+
+async def _handle_command(command: str, conversation_id: str) -> str:
+    """Handle system commands"""
+    cmd = command.split()[0] if command else ""
     
-    else:
+    handler = _COMMAND_HANDLERS.get(cmd)
+    if handler is None:
         return f"Unknown command: {cmd}\nUse /help to see available commands."
+    
+    return handler()
 
 
 async def _handle_stock_query(query: str, conversation_id: str) -> str:
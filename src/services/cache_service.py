@@ -7,6 +7,7 @@ from typing import Dict, Any, Optional, TypeVar, Generic
 import logging
 import json
 import hashlib
+import random
 from dataclasses import asdict
 from src.config.settings import settings
 
@@ -38,6 +39,7 @@ class InMemoryCache:
     def __init__(self):
         self._cache: Dict[str, CacheEntry] = {}
         self._lock = asyncio.Lock()
+        self.default_ttl_seconds = settings.cache_ttl_seconds
         self._cleanup_task: Optional[asyncio.Task] = None
         # NOTE: Do NOT start background tasks at import time. The event loop
         # may not be running when this module is imported (e.g. when the
@@ -74,9 +76,10 @@ class InMemoryCache:
     async def _cleanup_expired(self):
         """Remove expired entries from cache"""
         async with self._lock:
+            now = datetime.utcnow()
             expired_keys = [
                 key for key, entry in self._cache.items()
-                if entry.is_expired()
+                if now > entry.expires_at
             ]
             
             for key in expired_keys:
@@ -110,7 +113,7 @@ class InMemoryCache:
     async def set(self, key: str, value: Any, ttl_seconds: int = None) -> None:
         """Set value in cache with TTL"""
         if ttl_seconds is None:
-            ttl_seconds = settings.cache_ttl_seconds
+            ttl_seconds = self.default_ttl_seconds
         
         async with self._lock:
             self._cache[key] = CacheEntry(value, ttl_seconds)
@@ -132,7 +135,8 @@ class InMemoryCache:
         """Get cache statistics"""
         async with self._lock:
             total_entries = len(self._cache)
-            expired_entries = sum(1 for entry in self._cache.values() if entry.is_expired())
+            now = datetime.utcnow()
+            expired_entries = sum(1 for entry in self._cache.values() if now > entry.expires_at)
             
             return {
                 'total_entries': total_entries,
@@ -164,6 +168,7 @@ class CachedYFinanceService:
         self.cache = cache or InMemoryCache()
         self.retry_attempts = 3
         self.retry_delay = 1.0  # seconds
+        self.retry_max_delay = 10.0  # seconds
     
     async def get_current_data_cached(self, ticker: str) -> Dict[str, Any]:
         """Get current data with caching"""
@@ -312,7 +317,7 @@ class CachedYFinanceService:
             return False
     
     async def _retry_operation(self, operation, *args, **kwargs):
-        """Retry operation with exponential backoff"""
+        """Retry operation with capped exponential backoff and jitter"""
         last_exception = None
         
         for attempt in range(self.retry_attempts):
@@ -323,8 +328,10 @@ class CachedYFinanceService:
                 last_exception = e
                 
                 if attempt < self.retry_attempts - 1:
-                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                    logger.warning(f"Operation failed (attempt {attempt + 1}/{self.retry_attempts}), retrying in {delay}s: {e}")
+                    # Exponential backoff; jitter keeps concurrent callers from retrying in lockstep
+                    delay = min(self.retry_max_delay, self.retry_delay * (2 ** attempt))
+                    delay = random.uniform(delay / 2, delay)
+                    logger.warning(f"Operation failed (attempt {attempt + 1}/{self.retry_attempts}), retrying in {delay:.2f}s: {e}")
                     await asyncio.sleep(delay)
                 else:
                     logger.error(f"Operation failed after {self.retry_attempts} attempts: {e}")
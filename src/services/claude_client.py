@@ -7,7 +7,8 @@ import json
 import re
 from datetime import datetime
 import logging
-from anthropic import AsyncAnthropic
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 from src.config.settings import settings
 from src.models.market_data import MarketData, PricePoint
 from src.models.analysis import InvestmentRecommendation, RecommendationType
@@ -22,7 +23,16 @@ class ClaudeClient:
         if not settings.anthropic_api_key:
             raise ValueError("Anthropic API key not configured")
         
-        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+        # Size the connection pool explicitly so concurrent analyses reuse warm connections
+        self.client = AsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=settings.anthropic_max_connections,
+                    max_keepalive_connections=settings.anthropic_max_keepalive_connections
+                )
+            )
+        )
         self.model = settings.anthropic_model
         self.max_tokens = 4000
         self.temperature = 0.3  # Lower temperature for more consistent analysis
@@ -350,11 +350,11 @@ Risk Assessment: {ai_recommendation.risk_assessment[:100]}{'...' if len(ai_recom
     async def get_service_health(self) -> Dict[str, Any]:
         """Get health status of the analysis service"""
         try:
-            # Test market data service
-            market_health = await self.market_data_service.get_service_health()
-            
-            # Test AI analyzer
-            ai_health = await self.investment_analyzer.get_health_status()
+            # Test market data service and AI analyzer concurrently
+            market_health, ai_health = await asyncio.gather(
+                self.market_data_service.get_service_health(),
+                self.investment_analyzer.get_health_status()
+            )
             
             # Overall health
             is_healthy = (
@@ -5,12 +5,13 @@ import asyncio
 import time
 from datetime import datetime
 from typing import Dict, Any, Callable, Optional
-import json
 import logging
+import orjson
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 from src.services.logging_service import logging_service
+from src.models.timestamps import utc_now_iso
 from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -46,30 +47,30 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             # Capture response details
             response_data = self._capture_response_data(response)
             
-            # Log the request/response asynchronously
+            # Queue the request/response log entry; the write itself is batched off the request path
             if self.log_requests or self.log_responses:
-                asyncio.create_task(self._log_request_response(
+                await self._log_request_response(
                     request.url.path,
                     request.method,
                     request_data,
                     response_data,
                     response.status_code,
                     processing_time_ms
-                ))
+                )
             
             return response
             
         except Exception as e:
             processing_time_ms = int((time.time() - start_time) * 1000)
             
-            # Log the error
-            asyncio.create_task(logging_service.log_error(e, {
+            # Queue the error log entry; like request logs, the write is batched off the request path
+            await logging_service.log_error(e, {
                 'context': 'request_processing',
                 'path': request.url.path,
                 'method': request.method,
                 'processing_time_ms': processing_time_ms,
                 'request_data': request_data
-            }))
+            })
             
             raise
     
@@ -84,7 +85,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 'headers': dict(request.headers),
                 'client_ip': request.client.host if request.client else None,
                 'user_agent': request.headers.get('user-agent'),
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': utc_now_iso()
             }
             
             # Capture request body for POST requests (with size limit)
@@ -93,8 +94,8 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                     body = await request.body()
                     if len(body) < 10000:  # Limit to 10KB
                         try:
-                            request_data['body'] = json.loads(body.decode('utf-8'))
-                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            request_data['body'] = orjson.loads(body)
+                        except orjson.JSONDecodeError:
                             request_data['body'] = body.decode('utf-8', errors='ignore')[:1000]
                     else:
                         request_data['body'] = f"<body too large: {len(body)} bytes>"
@@ -116,10 +117,10 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     def _capture_response_data(self, response: Response) -> Dict[str, Any]:
         """Capture relevant response data for logging"""
         try:
+            # The log entry's own timestamp records when the response was logged
             response_data = {
                 'status_code': response.status_code,
-                'headers': dict(response.headers),
-                'timestamp': datetime.utcnow().isoformat()
+                'headers': dict(response.headers)
             }
             
             # Note: We don't capture response body here as it would require
@@ -272,22 +273,27 @@ class HealthMonitor:
                 'checks': {}
             }
             
-            # Run each health check
-            for name, check_function in self.health_checks.items():
-                try:
-                    check_result = await check_function()
-                    health_status['checks'][name] = check_result
-                    
-                    # Update overall status if any check is unhealthy
-                    if isinstance(check_result, dict) and check_result.get('status') != 'healthy':
-                        health_status['overall_status'] = 'degraded'
-                        
-                except Exception as e:
+            # Run all health checks concurrently
+            check_names = list(self.health_checks)
+            check_results = await asyncio.gather(
+                *(check_function() for check_function in self.health_checks.values()),
+                return_exceptions=True
+            )
+            
+            for name, check_result in zip(check_names, check_results):
+                if isinstance(check_result, Exception):
                     health_status['checks'][name] = {
                         'status': 'unhealthy',
-                        'error': str(e)
+                        'error': str(check_result)
                     }
                     health_status['overall_status'] = 'unhealthy'
+                    continue
+                
+                health_status['checks'][name] = check_result
+                
+                # Update overall status if any check is unhealthy
+                if isinstance(check_result, dict) and check_result.get('status') != 'healthy':
+                    health_status['overall_status'] = 'degraded'
             
             self.last_check_time = datetime.utcnow()
             return health_status
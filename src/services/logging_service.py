@@ -2,20 +2,162 @@
 Comprehensive logging service for NASDAQ Stock Agent with file-based logging
 """
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from datetime import timedelta
+from typing import Dict, List, Optional, Any, Set, Union
 import logging
 import traceback
-import json
+import orjson
 import os
+import time
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from src.models.analysis import StockAnalysis, AnalysisRequest, AnalysisResponse
 from src.config.settings import settings
+from src.models.timestamps import utc_now_iso
 
 logger = logging.getLogger(__name__)
 
+# Log/error ids are drawn from a pool filled with one urandom read per batch
+_ID_POOL_SIZE = 256
+_id_pool: deque = deque()
+
+
+def _new_log_id() -> str:
+    """Random (version 4) UUID string for a log entry"""
+    if not _id_pool:
+        entropy = os.urandom(16 * _ID_POOL_SIZE)
+        _id_pool.extend(
+            str(uuid.UUID(bytes=entropy[i:i + 16], version=4))
+            for i in range(0, len(entropy), 16)
+        )
+    return _id_pool.popleft()
+
+
+def _encode_entry(entry: Dict[str, Any]) -> bytes:
+    """Encode one log entry as a JSON line; values orjson can't encode are written as strings"""
+    return orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Batched JSONL writes run on a single thread so disk I/O stays off the event loop and in order
+_log_write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-writer")
+
+
+class _JsonlBatchWriter:
+    """Buffers JSON log entries and writes each batch to a file logger as a single record"""
+    
+    def __init__(self, file_logger: logging.Logger, level: int,
+                 max_batch_size: int = 100, flush_interval: float = 0.05,
+                 max_pending_writes: int = 100):
+        self.file_logger = file_logger
+        self.level = level
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_pending_writes = max_pending_writes
+        self._buffer: List[bytes] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending_writes: Set[asyncio.Future] = set()
+        self._stats = {
+            'batches': 0,
+            'entries': 0,
+            'dropped': 0
+        }
+    
+    def submit(self, entry: Dict[str, Any]) -> None:
+        """Queue an entry; the batch is written when full or when the flush interval elapses"""
+        if not self.file_logger.isEnabledFor(self.level):
+            return
+        
+        # Encoded one at a time so an entry that can't be serialized costs only itself
+        try:
+            self._buffer.append(_encode_entry(entry))
+        except orjson.JSONEncodeError as e:
+            self._stats['dropped'] += 1
+            logger.error("Dropped unserializable log entry: %s", e)
+            return
+        
+        if len(self._buffer) >= self.max_batch_size:
+            self.flush()
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to schedule the flush on, write straight away
+            self.flush()
+            return
+        
+        # A timer left on a previous (possibly closed) loop would never fire
+        if self._flush_handle is None or self._flush_loop is not loop:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+            self._flush_loop = loop
+            self._flush_handle = loop.call_later(self.flush_interval, self.flush)
+    
+    def flush(self) -> None:
+        """Hand all buffered entries to the writer thread"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        if not self._buffer:
+            return
+        
+        entries, self._buffer = self._buffer, []
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
+        # Shed load rather than queue without bound when the disk can't keep up
+        if loop is not None and len(self._pending_writes) >= self.max_pending_writes:
+            self._stats['dropped'] += len(entries)
+            logger.warning("Log writer backlog full, dropped %d entries", len(entries))
+            return
+        
+        self._stats['batches'] += 1
+        self._stats['entries'] += len(entries)
+        
+        if loop is None:
+            self._write(entries)
+            return
+        
+        pending = loop.run_in_executor(_log_write_executor, self._write, entries)
+        self._pending_writes.add(pending)
+        pending.add_done_callback(self._pending_writes.discard)
+    
+    def _write(self, entries: List[bytes]) -> None:
+        """Write encoded entries to the file logger as one record"""
+        try:
+            self.file_logger.log(self.level, b"\n".join(entries).decode())
+        except Exception as e:
+            logger.error("Failed to write batch of %d log entries: %s", len(entries), e)
+    
+    async def drain(self) -> None:
+        """Flush buffered entries and wait for in-flight writes to finish"""
+        self.flush()
+        loop = asyncio.get_running_loop()
+        # Writes handed off from another loop cannot be awaited here; the writer thread still completes them
+        pending = [write for write in self._pending_writes if write.get_loop() is loop]
+        self._pending_writes.intersection_update(pending)
+        if pending:
+            await asyncio.gather(*pending)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics"""
+        return {
+            **self._stats,
+            'buffered': len(self._buffer),
+            'writes_in_flight': len(self._pending_writes),
+            'max_batch_size': self.max_batch_size,
+            'flush_interval': self.flush_interval,
+            'max_pending_writes': self.max_pending_writes
+        }
+
 
 class LoggingService:
     """Comprehensive logging service with file-based storage"""
@@ -24,7 +166,22 @@ class LoggingService:
         self.logs_dir = Path("logs")
         self.analyses_logger = None
         self.errors_logger = None
+        self.api_requests_logger = None
         self._setup_file_loggers()
+        
+        # Analysis, error and API request entries are written in batches rather than one file write each
+        writer_options = {
+            'max_batch_size': settings.log_batch_size,
+            'flush_interval': settings.log_flush_interval_ms / 1000,
+            'max_pending_writes': settings.log_max_pending_batches
+        }
+        self._analysis_writer = _JsonlBatchWriter(self.analyses_logger, logging.INFO, **writer_options)
+        self._error_writer = _JsonlBatchWriter(self.errors_logger, logging.ERROR, **writer_options)
+        self._api_request_writer = _JsonlBatchWriter(self.api_requests_logger, logging.INFO, **writer_options)
+        
+        # Per (error type, path) one-minute windows, so one failing endpoint can't flood the error log
+        self._error_windows: Dict[tuple, List[float]] = {}
+        self._suppressed_errors = 0
     
     def _setup_file_loggers(self):
         """Setup file-based loggers with rotation"""
@@ -58,17 +215,30 @@ class LoggingService:
             errors_handler.setFormatter(logging.Formatter('%(message)s'))
             self.errors_logger.addHandler(errors_handler)
             
+            # Setup API requests logger, kept apart from errors so each file holds one entry type
+            self.api_requests_logger = logging.getLogger('api_requests')
+            self.api_requests_logger.setLevel(logging.INFO)
+            self.api_requests_logger.propagate = False
+            
+            api_requests_handler = RotatingFileHandler(
+                self.logs_dir / 'api_requests.jsonl',
+                maxBytes=10 * 1024 * 1024,  # 10MB
+                backupCount=5
+            )
+            api_requests_handler.setFormatter(logging.Formatter('%(message)s'))
+            self.api_requests_logger.addHandler(api_requests_handler)
+            
             logger.info("File-based logging initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to setup file loggers: {e}")
+            logger.error("Failed to setup file loggers: %s", e)
             raise
     
     async def log_analysis_request(self, request: AnalysisRequest, response: AnalysisResponse) -> str:
         """Log a complete analysis request and response"""
         try:
             log_entry = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utc_now_iso(),
                 "analysis_id": response.analysis_id,
                 "user_query": request.query,
                 "ticker_symbol": response.ticker,
@@ -78,16 +248,16 @@ class LoggingService:
                 "processing_time_ms": response.processing_time_ms
             }
             
-            # Write JSON line to file
-            self.analyses_logger.info(json.dumps(log_entry))
+            # Queue JSON line for the next batched file write
+            self._analysis_writer.submit(log_entry)
             
-            logger.info(f"Analysis logged: {response.analysis_id} for {response.ticker}")
+            logger.info("Analysis logged: %s for %s", response.analysis_id, response.ticker)
             return response.analysis_id
             
         except Exception as e:
-            logger.error(f"Failed to log analysis request: {e}")
+            logger.error("Failed to log analysis request: %s", e)
             # Fallback to console logging
-            logger.error(f"Analysis data: {response.analysis_id} - {response.ticker}")
+            logger.error("Analysis data: %s - %s", response.analysis_id, response.ticker)
             return "failed_to_log"
     
     async def log_stock_analysis(self, stock_analysis: StockAnalysis) -> str:
@@ -96,7 +266,7 @@ class LoggingService:
             if not stock_analysis.recommendation:
                 # Create a default log entry for failed analysis
                 log_entry = {
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": utc_now_iso(),
                     "analysis_id": stock_analysis.analysis_id,
                     "user_query": stock_analysis.query_text,
                     "ticker_symbol": stock_analysis.ticker,
@@ -107,7 +277,7 @@ class LoggingService:
                 }
             else:
                 log_entry = {
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": utc_now_iso(),
                     "analysis_id": stock_analysis.analysis_id,
                     "user_query": stock_analysis.query_text,
                     "ticker_symbol": stock_analysis.ticker,
@@ -117,72 +287,129 @@ class LoggingService:
                     "processing_time_ms": stock_analysis.processing_time_ms
                 }
             
-            # Write JSON line to file
-            self.analyses_logger.info(json.dumps(log_entry))
+            # Queue JSON line for the next batched file write
+            self._analysis_writer.submit(log_entry)
             
-            logger.info(f"Stock analysis logged: {stock_analysis.analysis_id}")
+            logger.info("Stock analysis logged: %s", stock_analysis.analysis_id)
             return stock_analysis.analysis_id
             
         except Exception as e:
-            logger.error(f"Failed to log stock analysis: {e}")
+            logger.error("Failed to log stock analysis: %s", e)
             # Fallback to console logging
-            logger.error(f"Stock analysis data: {stock_analysis.analysis_id} - {stock_analysis.ticker}")
+            logger.error("Stock analysis data: %s - %s", stock_analysis.analysis_id, stock_analysis.ticker)
             return "failed_to_log"
     
+    def _error_allowed(self, error_type: str, path: Any) -> bool:
+        """Count an error against its one-minute window and report whether it may be logged"""
+        now = time.monotonic()
+        key = (error_type, path)
+        window = self._error_windows.get(key)
+        
+        if window is None or now - window[0] >= 60.0:
+            if window is None and len(self._error_windows) >= 1024:
+                self._error_windows = {
+                    k: w for k, w in self._error_windows.items() if now - w[0] < 60.0
+                }
+            self._error_windows[key] = [now, 1]
+            return True
+        
+        if window[1] >= settings.error_log_max_per_minute:
+            self._suppressed_errors += 1
+            return False
+        
+        window[1] += 1
+        return True
+    
+    def _format_stack_trace(self, error: Exception) -> str:
+        """Format the innermost frames of an error's traceback, capped in length"""
+        stack_trace = "".join(traceback.format_exception(
+            type(error), error, error.__traceback__, limit=-settings.error_log_stack_max_frames
+        ))
+        if len(stack_trace) > settings.error_log_stack_max_chars:
+            stack_trace = stack_trace[:settings.error_log_stack_max_chars] + "...[truncated]"
+        return stack_trace
+    
     async def log_error(self, error: Exception, context: Dict[str, Any] = None) -> str:
         """Log an error with context information"""
         try:
-            error_id = str(uuid.uuid4())
+            error_type = type(error).__name__
+            if not self._error_allowed(error_type, (context or {}).get('path')):
+                return "rate_limited"
+            
+            error_id = _new_log_id()
             
             error_entry = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utc_now_iso(),
                 "error_id": error_id,
-                "error_type": type(error).__name__,
+                "error_type": error_type,
                 "error_message": str(error),
-                "stack_trace": traceback.format_exc(),
+                "stack_trace": self._format_stack_trace(error),
                 "context": context or {}
             }
             
-            # Write JSON line to file
-            self.errors_logger.error(json.dumps(error_entry))
+            # Queue JSON line for the next batched file write
+            self._error_writer.submit(error_entry)
             
-            logger.error(f"Error logged: {error_id} - {error_entry['error_message']}")
+            logger.error("Error logged: %s - %s", error_id, error_entry['error_message'])
             return error_id
             
         except Exception as e:
             # If we can't log to file, at least log to application logger
-            logger.critical(f"Failed to log error to file: {e}. Original error: {error}")
+            logger.critical("Failed to log error to file: %s. Original error: %s", e, error)
             return "failed_to_log"
     
+    def _build_api_log_entry(self, endpoint: str, method: str, request_data: Dict[str, Any],
+                             response_data: Dict[str, Any], status_code: int,
+                             processing_time_ms: int) -> Dict[str, Any]:
+        """Build an API request log entry"""
+        return {
+            'timestamp': utc_now_iso(),
+            'log_id': _new_log_id(),
+            'log_type': 'api_request',
+            'endpoint': endpoint,
+            'method': method,
+            'request_data': request_data,
+            'response_data': response_data,
+            'status_code': status_code,
+            'processing_time_ms': processing_time_ms
+        }
+    
     async def log_api_request(self, endpoint: str, method: str, request_data: Dict[str, Any], 
                              response_data: Dict[str, Any], status_code: int, 
                              processing_time_ms: int) -> str:
         """Log API request and response"""
         try:
-            log_id = str(uuid.uuid4())
-            
             # Create a custom log entry for API requests
-            api_log_entry = {
-                'timestamp': datetime.utcnow().isoformat(),
-                'log_id': log_id,
-                'log_type': 'api_request',
-                'endpoint': endpoint,
-                'method': method,
-                'request_data': request_data,
-                'response_data': response_data,
-                'status_code': status_code,
-                'processing_time_ms': processing_time_ms
-            }
+            api_log_entry = self._build_api_log_entry(
+                endpoint, method, request_data, response_data, status_code, processing_time_ms
+            )
             
-            # Write JSON line to file
-            self.errors_logger.info(json.dumps(api_log_entry))
+            # Queue JSON line for the next batched file write
+            self._api_request_writer.submit(api_log_entry)
             
-            logger.info(f"API request logged: {method} {endpoint} - {status_code} ({processing_time_ms}ms)")
-            return log_id
+            logger.info("API request logged: %s %s - %s (%sms)", method, endpoint, status_code, processing_time_ms)
+            return api_log_entry['log_id']
             
         except Exception as e:
-            logger.error(f"Failed to log API request: {e}")
+            logger.error("Failed to log API request: %s", e)
             return "failed_to_log"
+    
+    async def flush(self) -> None:
+        """Write any buffered log entries and wait for them to reach disk"""
+        await asyncio.gather(
+            self._analysis_writer.drain(),
+            self._error_writer.drain(),
+            self._api_request_writer.drain()
+        )
+    
+    def get_batching_stats(self) -> Dict[str, Any]:
+        """Get batched write statistics"""
+        return {
+            'analyses': self._analysis_writer.get_stats(),
+            'errors': self._error_writer.get_stats(),
+            'api_requests': self._api_request_writer.get_stats(),
+            'suppressed_errors': self._suppressed_errors
+        }
 
 
 # Global logging service instance
@@ -20,8 +20,37 @@ class MarketDataService:
         self.yfinance_service = YFinanceService()
         self.cached_service = CachedYFinanceService(self.yfinance_service, global_cache)
         self._circuit_breaker = CircuitBreaker()
+        # Fetches currently running, per ticker, so concurrent callers share one request
+        self._inflight: Dict[str, asyncio.Task] = {}
     
     async def get_stock_data(self, ticker: str) -> MarketData:
+        """Get comprehensive stock data, joining a fetch for the same ticker if one is already running"""
+        return await asyncio.shield(self._start_fetch(ticker))
+    
+    def prefetch_stock_data(self, ticker: str) -> None:
+        """Start fetching a ticker in the background so a following get_stock_data call finds it in flight or cached"""
+        if self._is_valid_ticker_format(ticker):
+            self._start_fetch(ticker)
+    
+    def _start_fetch(self, ticker: str) -> asyncio.Task:
+        """Get the running fetch for a ticker, starting one if needed"""
+        key = ticker.upper()
+        task = self._inflight.get(key)
+        
+        if task is None:
+            task = asyncio.create_task(self._fetch_stock_data(ticker))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._on_fetch_done(key, done))
+        
+        return task
+    
+    def _on_fetch_done(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished fetch; its errors are reported to whoever awaited it"""
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # Mark as retrieved for prefetches nobody awaited
+    
+    async def _fetch_stock_data(self, ticker: str) -> MarketData:
         """Get comprehensive stock data with full error handling and caching"""
         try:
             # Validate ticker format first
@@ -58,6 +87,11 @@ class MarketDataService:
             logger.error(f"Failed to get stock data for {ticker}: {e}")
             raise
     
+    async def warm_up(self) -> None:
+        """Make one Yahoo Finance request so the first user query does not pay for session and TLS setup"""
+        status = await self.get_market_status()
+        logger.info(f"Market data connection warmed up (market state: {status.get('market_state', 'UNKNOWN')})")
+    
     async def validate_ticker(self, ticker: str) -> bool:
         """Validate ticker symbol with caching"""
         try:
@@ -129,30 +163,27 @@ class MarketDataService:
                 'cache_stats': await self.cached_service.get_cache_stats()
             }
             
-            # Test ticker validation
-            try:
-                is_valid = await asyncio.wait_for(
-                    self.validate_ticker(test_ticker),
-                    timeout=5.0
-                )
-                health_status['ticker_validation'] = 'healthy' if is_valid else 'unhealthy'
-            except asyncio.TimeoutError:
+            # Test ticker validation and market status concurrently
+            is_valid, market_status = await asyncio.gather(
+                asyncio.wait_for(self.validate_ticker(test_ticker), timeout=5.0),
+                asyncio.wait_for(self.get_market_status(), timeout=5.0),
+                return_exceptions=True
+            )
+            
+            if isinstance(is_valid, asyncio.TimeoutError):
                 health_status['ticker_validation'] = 'timeout'
-            except Exception as e:
-                health_status['ticker_validation'] = f'error: {e}'
+            elif isinstance(is_valid, Exception):
+                health_status['ticker_validation'] = f'error: {is_valid}'
+            else:
+                health_status['ticker_validation'] = 'healthy' if is_valid else 'unhealthy'
             
-            # Test market status
-            try:
-                market_status = await asyncio.wait_for(
-                    self.get_market_status(),
-                    timeout=5.0
-                )
+            if isinstance(market_status, asyncio.TimeoutError):
+                health_status['market_status_check'] = 'timeout'
+            elif isinstance(market_status, Exception):
+                health_status['market_status_check'] = f'error: {market_status}'
+            else:
                 health_status['market_status_check'] = 'healthy'
                 health_status['market_is_open'] = market_status.get('is_open', False)
-            except asyncio.TimeoutError:
-                health_status['market_status_check'] = 'timeout'
-            except Exception as e:
-                health_status['market_status_check'] = f'error: {e}'
             
             # Overall health determination
             checks = [
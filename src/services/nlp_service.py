@@ -371,7 +371,18 @@ class CompanyNameResolver:
     async def get_company_info(self, ticker: str) -> Optional[Dict[str, str]]:
         """Get company information by ticker"""
         return self._get_company_data_by_ticker(ticker.upper())
-    
+
+    def lookup_exact_ticker(self, query: str) -> Optional[str]:
+        """Resolve a query to a ticker using only exact ticker or alias matches"""
+        if not query or not query.strip():
+            return None
+
+        ticker_match = self._check_if_ticker(query.strip().upper())
+        if ticker_match:
+            return ticker_match.ticker
+
+        return self.aliases.get(self._clean_company_name(query))
+
     async def suggest_alternatives(self, invalid_query: str) -> List[CompanyMatch]:
         """Suggest alternative company names for invalid queries"""
         # Use fuzzy matching with lower threshold for suggestions
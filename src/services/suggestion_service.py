@@ -17,6 +17,18 @@ class QuerySuggestionService:
         self.company_resolver = company_resolver
         self.common_misspellings = self._build_misspelling_database()
         self.query_patterns = self._build_query_patterns()
+        self.name_index = self._build_name_index()
+    
+    def _build_name_index(self) -> Dict[str, str]:
+        """Build lowercase company name/alias -> ticker index for fuzzy matching"""
+        name_index = {}
+        
+        for company_data in self.company_resolver.company_database.values():
+            ticker = company_data['ticker']
+            for name in [company_data['name'], *company_data['aliases']]:
+                name_index.setdefault(name.lower(), ticker)
+        
+        return name_index
     
     def _build_misspelling_database(self) -> Dict[str, str]:
         """Build database of common company name misspellings"""
@@ -249,37 +261,24 @@ class QuerySuggestionService:
         """Perform fuzzy matching against all known companies"""
         matches = []
         
-        # Get all company names and aliases
-        all_names = []
-        for company_data in self.company_resolver.company_database.values():
-            all_names.append(company_data['name'])
-            all_names.extend(company_data['aliases'])
-        
         # Use difflib to find close matches
         close_matches = get_close_matches(
             query.lower(), 
-            [name.lower() for name in all_names], 
+            self.name_index.keys(), 
             n=5, 
             cutoff=0.4
         )
         
         for match in close_matches:
-            # Find the ticker for this match
-            ticker = None
-            for alias, tick in self.company_resolver.aliases.items():
-                if alias == match:
-                    ticker = tick
-                    break
-            
-            if ticker:
-                company_data = self.company_resolver._get_company_data_by_ticker(ticker)
-                if company_data:
-                    matches.append({
-                        'ticker': ticker,
-                        'company_name': company_data['name'],
-                        'match_score': 0.6,  # Approximate score for fuzzy matches
-                        'matched_text': match
-                    })
+            ticker = self.name_index[match]
+            company_data = self.company_resolver._get_company_data_by_ticker(ticker)
+            if company_data:
+                matches.append({
+                    'ticker': ticker,
+                    'company_name': company_data['name'],
+                    'match_score': 0.6,  # Approximate score for fuzzy matches
+                    'matched_text': match
+                })
         
         return matches
     
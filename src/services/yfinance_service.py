@@ -1,22 +1,41 @@
 """
 Yahoo Finance integration service for NASDAQ Stock Agent
 """
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 import logging
 from src.models.market_data import MarketData, PricePoint
 from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# yfinance does blocking HTTP; its calls run on a bounded pool so they never stall the event loop
+_yfinance_executor = ThreadPoolExecutor(
+    max_workers=settings.yfinance_max_workers,
+    thread_name_prefix="yfinance"
+)
+
+
+def _fetch_ticker_info(ticker: str) -> Dict[str, Any]:
+    """Fetch the yfinance info dict for a ticker (blocking)"""
+    return yf.Ticker(ticker).info
+
 
 class YFinanceService:
     """Service for fetching market data from Yahoo Finance"""
     
     def __init__(self):
         self.timeout = settings.yfinance_timeout
+    
+    async def _run_blocking(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking yfinance call on the yfinance thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_yfinance_executor, functools.partial(func, *args, **kwargs))
         
     async def get_current_data(self, ticker: str) -> Dict[str, Any]:
         """Fetch current market data for a ticker symbol"""
@@ -27,11 +46,8 @@ class YFinanceService:
             if not self._is_valid_ticker_format(ticker):
                 raise ValueError(f"Invalid ticker format: {ticker}")
             
-            # Create yfinance Ticker object
-            stock = yf.Ticker(ticker)
-            
             # Get current info
-            info = stock.info
+            info = await self._run_blocking(_fetch_ticker_info, ticker)
             
             if not info or 'regularMarketPrice' not in info:
                 raise ValueError(f"No data found for ticker: {ticker}")
@@ -71,7 +87,8 @@ class YFinanceService:
             stock = yf.Ticker(ticker)
             
             # Get historical data
-            hist_data = stock.history(
+            hist_data = await self._run_blocking(
+                stock.history,
                 start=start_date.strftime('%Y-%m-%d'),
                 end=end_date.strftime('%Y-%m-%d'),
                 interval='1d'
@@ -151,8 +168,7 @@ class YFinanceService:
                 return False
             
             # Try to fetch basic info
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = await self._run_blocking(_fetch_ticker_info, ticker)
             
             # Check if we got valid data
             if not info or len(info) < 5:  # Minimal info should have more than 5 fields
@@ -264,8 +280,7 @@ class YFinanceService:
         """Get current market status (open/closed)"""
         try:
             # Use a major index to determine market status
-            spy = yf.Ticker("SPY")  # S&P 500 ETF
-            info = spy.info
+            info = await self._run_blocking(_fetch_ticker_info, "SPY")  # S&P 500 ETF
             
             # Get market state
             market_state = info.get('marketState', 'UNKNOWN')
@@ -0,0 +1,11 @@
+"""
+Shared test configuration.
+
+Settings are read once at import, and the agent modules refuse to load
+without an Anthropic API key, so a placeholder is set before any test
+module imports them.
+"""
+
+import os
+
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
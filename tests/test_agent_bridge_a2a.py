@@ -67,7 +67,7 @@ class TestA2AForwarding:
     
     def test_lookup_agent_success(self):
         """Test successful agent lookup in registry."""
-        with patch('requests.get') as mock_get:
+        with patch.object(self.bridge._http, 'get') as mock_get:
             # Mock successful registry response
             mock_response = Mock()
             mock_response.status_code = 200
@@ -85,7 +85,7 @@ class TestA2AForwarding:
     
     def test_lookup_agent_not_found(self):
         """Test agent lookup when agent is not in registry."""
-        with patch('requests.get') as mock_get:
+        with patch.object(self.bridge._http, 'get') as mock_get:
             # Mock 404 response
             mock_response = Mock()
             mock_response.status_code = 404
@@ -107,7 +107,7 @@ class TestA2AForwarding:
     
     def test_lookup_agent_registry_error(self):
         """Test agent lookup when registry request fails."""
-        with patch('requests.get', side_effect=Exception("Connection error")):
+        with patch.object(self.bridge._http, 'get', side_effect=Exception("Connection error")):
             result = self.bridge._lookup_agent("test-agent")
             
             # Verify None returned on error
@@ -0,0 +1,88 @@
+"""
+Test the cached GET /api/v1/agent/info body.
+
+Covers:
+- Reuse of the body while the NEST state is unchanged
+- Rebuilding when the NEST public URL changes
+- Not caching a body built after the NEST status failed
+"""
+
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routers import agent
+
+
+class _FakeNestAdapter:
+    """NEST adapter stand-in that counts status reads"""
+
+    def __init__(self):
+        self.config = SimpleNamespace(agent_id="nest-agent", nest_public_url="http://nest-a:6000")
+        self.status_calls = 0
+        self.fail = False
+
+    def is_running(self):
+        return True
+
+    async def get_status(self):
+        self.status_calls += 1
+        if self.fail:
+            raise RuntimeError("NEST unavailable")
+        return {
+            "nest_running": True,
+            "agent_id": self.config.agent_id,
+            "public_url": self.config.nest_public_url
+        }
+
+
+class TestAgentInfoCache:
+    """Test the /info cache keyed on NEST state."""
+
+    def setup_method(self):
+        """Set up a client for the agent router with a fake NEST adapter."""
+        self.adapter = _FakeNestAdapter()
+        app = FastAPI()
+        app.include_router(agent.router)
+        self.client = TestClient(app)
+
+    def _get_info(self, monkeypatch):
+        monkeypatch.setattr(agent, "_get_nest_adapter", lambda: self.adapter)
+        return self.client.get("/api/v1/agent/info")
+
+    def test_body_is_reused_while_state_is_unchanged(self, monkeypatch):
+        """Test NEST status is read once for repeated requests."""
+        monkeypatch.setattr(agent, "_agent_info_cache", (None, b""))
+
+        first = self._get_info(monkeypatch).json()
+        second = self._get_info(monkeypatch).json()
+
+        assert self.adapter.status_calls == 1
+        assert first["agent_id"] == second["agent_id"] == "nest-agent"
+        assert second["a2a_endpoint"] == "http://nest-a:6000/a2a"
+
+    def test_public_url_change_rebuilds_body(self, monkeypatch):
+        """Test a new public URL is reflected without a restart."""
+        monkeypatch.setattr(agent, "_agent_info_cache", (None, b""))
+        self._get_info(monkeypatch)
+
+        self.adapter.config.nest_public_url = "http://nest-b:6000"
+        body = self._get_info(monkeypatch).json()
+
+        assert self.adapter.status_calls == 2
+        assert body["a2a_endpoint"] == "http://nest-b:6000/a2a"
+
+    def test_body_from_failed_status_is_not_cached(self, monkeypatch):
+        """Test a body built while NEST status failed is rebuilt on the next request."""
+        monkeypatch.setattr(agent, "_agent_info_cache", (None, b""))
+        self.adapter.fail = True
+        degraded = self._get_info(monkeypatch).json()
+
+        self.adapter.fail = False
+        recovered = self._get_info(monkeypatch).json()
+
+        assert degraded["agent_id"] == "nasdaq-stock-agent"
+        assert "a2a_endpoint" not in degraded
+        assert recovered["agent_id"] == "nest-agent"
+        assert self.adapter.status_calls == 2
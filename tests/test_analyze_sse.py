@@ -0,0 +1,91 @@
+"""
+Test the event-stream response mode of POST /api/v1/analyze.
+
+Covers:
+- Progress then result events for a successful analysis
+- Progress then error events for a failed analysis
+"""
+
+from datetime import datetime, timezone
+
+import orjson
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routers import analysis
+from src.models.analysis import AnalysisResponse
+
+
+def _parse_events(body):
+    """Split an event-stream body into (event, data) pairs, skipping comment frames"""
+    events = []
+    for frame in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in frame.splitlines() if not line.startswith(":"))
+        if fields:
+            events.append((fields["event"], orjson.loads(fields["data"])))
+    return events
+
+
+class TestAnalyzeEventStream:
+    """Test POST /analyze with Accept: text/event-stream."""
+
+    def setup_method(self):
+        """Set up a client for the analysis router alone."""
+        app = FastAPI()
+        app.include_router(analysis.router)
+        self.client = TestClient(app)
+
+    def _post(self, query):
+        return self.client.post(
+            "/api/v1/analyze",
+            json={"query": query},
+            headers={"Accept": "text/event-stream"}
+        )
+
+    def test_streams_progress_then_result(self, monkeypatch):
+        """Test a successful analysis streams a progress event and then the result."""
+        async def process_analysis_request(request):
+            return AnalysisResponse(
+                analysis_id="test-analysis",
+                ticker="AAPL",
+                company_name="Apple Inc.",
+                current_price=190.0,
+                price_change_percentage=1.5,
+                recommendation="Buy",
+                confidence_score=80.0,
+                reasoning="Strong momentum",
+                key_factors=["Momentum"],
+                risk_assessment="Moderate",
+                summary="Buy AAPL",
+                processing_time_ms=5,
+                timestamp=datetime.now(timezone.utc)
+            )
+
+        monkeypatch.setattr(analysis.agent_orchestrator, "process_analysis_request", process_analysis_request)
+
+        response = self._post("Apple")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_events(response.text)
+        assert [event for event, _ in events] == ["progress", "result"]
+        assert events[0][1]["status"] == "analyzing"
+        assert events[0][1]["query"] == "Apple"
+        assert events[1][1]["ticker"] == "AAPL"
+        assert events[1][1]["analysis_id"] == "test-analysis"
+
+    def test_streams_error_event_on_failure(self, monkeypatch):
+        """Test a failed analysis ends the stream with an error event."""
+        async def process_analysis_request(request):
+            raise RuntimeError("agent unavailable")
+
+        monkeypatch.setattr(analysis.agent_orchestrator, "process_analysis_request", process_analysis_request)
+
+        response = self._post("Apple")
+
+        assert response.status_code == 200
+        events = _parse_events(response.text)
+        assert [event for event, _ in events] == ["progress", "error"]
+        assert events[1][1]["error_code"] == "ANALYSIS_FAILED"
+        assert "agent unavailable" in events[1][1]["error_message"]
+
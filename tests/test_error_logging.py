@@ -0,0 +1,63 @@
+"""
+Test error log rate limiting and stack trace capping in the logging service.
+
+Covers:
+- Per-minute limit for one error type on one path
+- Innermost-frame limit for logged stack traces
+"""
+
+from src.config.settings import settings
+from src.services.logging_service import logging_service
+
+
+def _raise_nested(depth):
+    """Raise a RuntimeError from depth nested calls"""
+    if depth == 0:
+        raise RuntimeError("innermost failure")
+    _call_nested(depth - 1)
+
+
+def _call_nested(depth):
+    """Alternate frames so the traceback doesn't collapse repeated lines"""
+    _raise_nested(depth)
+
+
+class TestErrorRateLimiting:
+    """Test per-minute error log rate limiting."""
+
+    def test_errors_beyond_limit_are_suppressed(self):
+        """Test one error type on one path is capped per minute."""
+        limit = settings.error_log_max_per_minute
+        suppressed_before = logging_service._suppressed_errors
+
+        allowed = [
+            logging_service._error_allowed("TestRateLimitError", "/rate-limited")
+            for _ in range(limit + 2)
+        ]
+
+        assert allowed == [True] * limit + [False, False]
+        assert logging_service._suppressed_errors == suppressed_before + 2
+
+    def test_limit_is_per_path(self):
+        """Test errors on another path are counted separately."""
+        limit = settings.error_log_max_per_minute
+        for _ in range(limit):
+            logging_service._error_allowed("TestPathError", "/first")
+
+        assert logging_service._error_allowed("TestPathError", "/first") is False
+        assert logging_service._error_allowed("TestPathError", "/second") is True
+
+
+class TestStackTraceCapping:
+    """Test stack trace formatting for error log entries."""
+
+    def test_only_innermost_frames_are_kept(self):
+        """Test deep tracebacks keep the configured number of innermost frames."""
+        try:
+            _raise_nested(settings.error_log_stack_max_frames * 2)
+        except RuntimeError as e:
+            stack_trace = logging_service._format_stack_trace(e)
+
+        assert stack_trace.count('File "') == settings.error_log_stack_max_frames
+        assert "innermost failure" in stack_trace
+        assert "test_only_innermost_frames_are_kept" not in stack_trace
@@ -0,0 +1,55 @@
+"""
+Test the bounded component probes behind GET /status.
+
+Covers:
+- Probe results passed through unchanged
+- Hung probes reported as timeouts
+- Failing probes reported as errors
+"""
+
+import asyncio
+import inspect
+
+import pytest
+
+from src.api.routers import health
+
+
+class TestStatusProbe:
+    """Test health._probe."""
+
+    @pytest.mark.asyncio
+    async def test_result_is_passed_through(self):
+        """Test a probe that answers in time returns its own status."""
+        async def healthy():
+            return {"status": "healthy"}
+
+        assert await health._probe(healthy(), "component") == {"status": "healthy"}
+
+    @pytest.mark.asyncio
+    async def test_hung_probe_times_out(self):
+        """Test a probe that never answers is reported as a timeout once its bound elapses."""
+        async def hung():
+            await asyncio.Event().wait()
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await health._probe(hung(), "market_data_service", timeout=0.05)
+
+        assert result == {"status": "timeout", "component": "market_data_service"}
+        assert loop.time() - start < 1.0
+
+    @pytest.mark.asyncio
+    async def test_failing_probe_reports_error(self):
+        """Test a probe that raises is reported in place."""
+        async def failing():
+            raise RuntimeError("connection refused")
+
+        result = await health._probe(failing(), "analysis_service")
+
+        assert result == {"status": "error", "component": "analysis_service", "message": "connection refused"}
+
+    def test_default_timeout_is_two_seconds(self):
+        """Test probes are bounded by the 2s status timeout by default."""
+        assert health.STATUS_PROBE_TIMEOUT == 2.0
+        assert inspect.signature(health._probe).parameters["timeout"].default == health.STATUS_PROBE_TIMEOUT
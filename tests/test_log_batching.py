@@ -0,0 +1,117 @@
+"""
+Test batched log writing in the logging service.
+
+Covers:
+- _JsonlBatchWriter batching and draining
+- Per-entry encoding, so one bad entry does not lose its batch
+- Dropping batches once the write backlog is full
+"""
+
+import logging
+from decimal import Decimal
+
+import orjson
+import pytest
+
+from src.services.logging_service import _JsonlBatchWriter
+
+
+class _RecordingHandler(logging.Handler):
+    """Keeps emitted log messages in memory"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestJsonlBatchWriter:
+    """Test _JsonlBatchWriter batching, draining and encoding."""
+
+    def setup_method(self):
+        """Set up a file logger that records what the writer emits."""
+        self.handler = _RecordingHandler()
+        self.file_logger = logging.getLogger("test_jsonl_batch_writer")
+        self.file_logger.setLevel(logging.INFO)
+        self.file_logger.propagate = False
+        self.file_logger.handlers = [self.handler]
+
+    def _written_entries(self):
+        return [orjson.loads(line) for message in self.handler.messages for line in message.splitlines()]
+
+    @pytest.mark.asyncio
+    async def test_drain_writes_buffered_entries_as_one_batch(self):
+        """Test drain writes everything submitted in a single record."""
+        writer = _JsonlBatchWriter(self.file_logger, logging.INFO, flush_interval=60)
+
+        for i in range(3):
+            writer.submit({"n": i})
+        assert self.handler.messages == []
+
+        await writer.drain()
+
+        assert len(self.handler.messages) == 1
+        assert self._written_entries() == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert writer.get_stats()["batches"] == 1
+        assert writer.get_stats()["buffered"] == 0
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_flushed_immediately(self):
+        """Test reaching max_batch_size hands the batch off without waiting for the timer."""
+        writer = _JsonlBatchWriter(self.file_logger, logging.INFO, max_batch_size=2, flush_interval=60)
+
+        writer.submit({"n": 0})
+        writer.submit({"n": 1})
+
+        assert writer.get_stats()["buffered"] == 0
+        await writer.drain()
+        assert self._written_entries() == [{"n": 0}, {"n": 1}]
+
+    def test_entries_below_logger_level_are_skipped(self):
+        """Test entries the file logger would discard are never buffered."""
+        writer = _JsonlBatchWriter(self.file_logger, logging.DEBUG)
+
+        writer.submit({"n": 0})
+
+        assert writer.get_stats()["buffered"] == 0
+        assert writer.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_values_without_json_type_are_written_as_strings(self):
+        """Test values orjson does not know, like Decimal, are stringified rather than failing."""
+        writer = _JsonlBatchWriter(self.file_logger, logging.INFO, flush_interval=60)
+
+        writer.submit({"price": Decimal("190.25")})
+        await writer.drain()
+
+        assert self._written_entries() == [{"price": "190.25"}]
+
+    @pytest.mark.asyncio
+    async def test_unencodable_entry_is_dropped_alone(self):
+        """Test an entry that cannot be encoded is dropped and counted without losing its batch."""
+        writer = _JsonlBatchWriter(self.file_logger, logging.INFO, flush_interval=60)
+
+        writer.submit({"n": 0})
+        writer.submit({"n": 2 ** 70})
+        writer.submit({"n": 2})
+        await writer.drain()
+
+        assert self._written_entries() == [{"n": 0}, {"n": 2}]
+        stats = writer.get_stats()
+        assert stats["entries"] == 2
+        assert stats["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batches_beyond_pending_limit_are_dropped(self):
+        """Test batches are dropped and counted once the write backlog is full."""
+        writer = _JsonlBatchWriter(self.file_logger, logging.INFO, flush_interval=60, max_pending_writes=0)
+
+        writer.submit({"n": 0})
+        writer.submit({"n": 1})
+        await writer.drain()
+
+        assert self.handler.messages == []
+        assert writer.get_stats()["dropped"] == 2
+        assert writer.get_stats()["batches"] == 0
@@ -0,0 +1,39 @@
+"""
+Test MCP request handler audit logging and shutdown.
+
+Covers:
+- Audit log entries for tool calls
+- Flushing buffered log entries on cleanup
+"""
+
+import pytest
+
+from src.mcp.request_handler import MCPRequestHandler
+from src.mcp.tool_registry import MCPToolRegistry
+from src.services.logging_service import logging_service
+
+
+class TestMCPRequestHandlerCleanup:
+    """Test MCPRequestHandler.cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_cleanup_writes_buffered_log_entries(self):
+        """Test the tool call's audit entry is written, not left buffered, after cleanup."""
+        async def get_market_data(parameters):
+            return {"ticker": parameters["ticker"]}
+
+        registry = MCPToolRegistry()
+        handler = MCPRequestHandler(registry)
+        await handler.initialize()
+        # Replace the market data tool so the call does not reach Yahoo Finance
+        registry.register_tool_handler("get_market_data", get_market_data)
+        entries_before = logging_service.get_batching_stats()["api_requests"]["entries"]
+
+        response = await handler.handle_tool_call("get_market_data", {"ticker": "AAPL"})
+        await handler.cleanup()
+
+        api_requests = logging_service.get_batching_stats()["api_requests"]
+        assert response.isError is False
+        assert api_requests["buffered"] == 0
+        assert api_requests["writes_in_flight"] == 0
+        assert api_requests["entries"] == entries_before + 1
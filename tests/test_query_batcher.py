@@ -0,0 +1,110 @@
+"""
+Test coalescing of identical agent queries in AgentQueryBatcher.
+
+Covers:
+- Identical in-flight queries sharing one run
+- Separate runs for different or finished queries
+- Caller cancellation not cancelling the shared run
+- Shutdown failing pending futures
+"""
+
+import asyncio
+
+import pytest
+
+from src.mcp.query_batcher import AgentQueryBatcher
+
+
+class TestAgentQueryBatcher:
+    """Test AgentQueryBatcher coalescing and shutdown."""
+
+    def setup_method(self):
+        """Set up a batcher around a slow, counting query function."""
+        self.calls = []
+        self.release = None
+        self.batcher = AgentQueryBatcher(self._query)
+
+    async def _query(self, query):
+        self.calls.append(query)
+        if self.release is not None:
+            await self.release.wait()
+        return {"query": query}
+
+    @pytest.mark.asyncio
+    async def test_identical_queries_share_one_run(self):
+        """Test concurrent identical queries run the agent once."""
+        self.release = asyncio.Event()
+
+        futures = [self.batcher.submit("AAPL") for _ in range(3)]
+        self.release.set()
+        results = await asyncio.gather(*futures)
+
+        assert self.calls == ["AAPL"]
+        assert results == [{"query": "AAPL"}] * 3
+        assert self.batcher.get_stats()["coalesced_queries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_different_queries_run_separately(self):
+        """Test queries with different keys are not coalesced."""
+        results = await asyncio.gather(self.batcher.submit("AAPL"), self.batcher.submit("MSFT"))
+
+        assert sorted(self.calls) == ["AAPL", "MSFT"]
+        assert results == [{"query": "AAPL"}, {"query": "MSFT"}]
+
+    @pytest.mark.asyncio
+    async def test_finished_query_is_not_reused(self):
+        """Test a query submitted after the first finished runs again."""
+        await self.batcher.submit("AAPL")
+        await self.batcher.submit("AAPL")
+
+        assert self.calls == ["AAPL", "AAPL"]
+        assert self.batcher.get_stats()["inflight_queries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_lone_query_does_not_wait(self):
+        """Test a single query completes without any batching delay."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        await self.batcher.submit("AAPL")
+
+        assert loop.time() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        """Test a failed run raises in all coalesced callers."""
+        async def failing_query(query):
+            await asyncio.sleep(0)
+            raise RuntimeError("agent unavailable")
+
+        batcher = AgentQueryBatcher(failing_query)
+        results = await asyncio.gather(batcher.submit("AAPL"), batcher.submit("AAPL"),
+                                       return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_keeps_run_shared(self):
+        """Test cancelling the first caller neither cancels the run nor starts a duplicate."""
+        self.release = asyncio.Event()
+
+        first = asyncio.ensure_future(asyncio.shield(self.batcher.submit("AAPL")))
+        await asyncio.sleep(0)
+        first.cancel()
+        second = self.batcher.submit("AAPL")
+        self.release.set()
+
+        assert await second == {"query": "AAPL"}
+        assert self.calls == ["AAPL"]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_fails_pending_futures(self):
+        """Test shutdown cancels running queries so callers do not wait forever."""
+        self.release = asyncio.Event()
+
+        future = self.batcher.submit("AAPL")
+        await asyncio.sleep(0)
+        await self.batcher.shutdown()
+
+        assert future.cancelled()
+        assert self.batcher.get_stats()["inflight_queries"] == 0
@@ -0,0 +1,42 @@
+"""
+Test the shared UTC timestamp helpers.
+
+Covers:
+- ISO 8601 format with milliseconds and offset
+- Reuse of the formatted string within one millisecond
+"""
+
+from datetime import datetime, timezone
+
+from src.models import timestamps
+
+
+class TestUtcNowIso:
+    """Test utc_now_iso formatting and caching."""
+
+    def test_format_has_milliseconds_and_offset(self, monkeypatch):
+        """Test the timestamp is timezone-aware with millisecond precision."""
+        monkeypatch.setattr(timestamps.time, "time_ns", lambda: 1_700_000_000_123_456_789)
+
+        value = timestamps.utc_now_iso()
+
+        assert value == "2023-11-14T22:13:20.123+00:00"
+        assert datetime.fromisoformat(value).tzinfo == timezone.utc
+
+    def test_same_millisecond_reuses_formatted_value(self, monkeypatch):
+        """Test calls within one millisecond return the cached string."""
+        now_ns = [1_700_000_000_123_000_000]
+        monkeypatch.setattr(timestamps.time, "time_ns", lambda: now_ns[0])
+
+        first = timestamps.utc_now_iso()
+        now_ns[0] += 500_000
+        second = timestamps.utc_now_iso()
+        now_ns[0] += 500_000
+        third = timestamps.utc_now_iso()
+
+        assert second is first
+        assert third == "2023-11-14T22:13:20.124+00:00"
+
+    def test_utc_now_is_timezone_aware(self):
+        """Test utc_now returns an aware UTC datetime."""
+        assert timestamps.utc_now().tzinfo == timezone.utc
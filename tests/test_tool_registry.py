@@ -0,0 +1,64 @@
+"""
+Test MCP tool registry parameter validation.
+
+Covers:
+- Memoized validation on the interpreted (non-compiled) path
+- Cache invalidation when tools change
+"""
+
+import pytest
+
+from src.mcp.tool_registry import MCPToolRegistry
+
+
+class TestCachedValidation:
+    """Test the lru_cache-backed parameter validation."""
+
+    def setup_method(self):
+        """Set up a registry that validates without compiled schemas."""
+        async def get_market_data(parameters):
+            return {"ticker": parameters["ticker"]}
+
+        self.registry = MCPToolRegistry()
+        self.registry.register_tool_handler("get_market_data", get_market_data)
+        # Force the interpreted validator, which is the memoized one
+        self.registry._validators.clear()
+
+    @pytest.mark.asyncio
+    async def test_repeated_parameters_hit_the_cache(self):
+        """Test identical parameters are validated once."""
+        for _ in range(3):
+            response = await self.registry.execute_tool("get_market_data", {"ticker": "AAPL"})
+            assert response.isError is False
+
+        cache_info = self.registry._cached_validation.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_failures_report_the_same_error(self):
+        """Test a cached validation failure still rejects the call."""
+        for _ in range(2):
+            response = await self.registry.execute_tool("get_market_data", {"ticker": 5})
+            assert response.isError is True
+            assert "Parameter 'ticker' must be a string" in response.content[0]["text"]
+
+        assert self.registry._cached_validation.cache_info().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_same_value_with_different_type_is_validated_separately(self):
+        """Test 1 and True are not treated as the same cached parameters."""
+        await self.registry.execute_tool("get_market_data", {"ticker": "AAPL", "include_historical": True})
+        response = await self.registry.execute_tool("get_market_data", {"ticker": "AAPL", "include_historical": 1})
+
+        assert response.isError is True
+        assert self.registry._cached_validation.cache_info().misses == 2
+
+    @pytest.mark.asyncio
+    async def test_registering_a_tool_clears_the_cache(self):
+        """Test a registry change drops memoized results."""
+        await self.registry.execute_tool("get_market_data", {"ticker": "AAPL"})
+
+        self.registry.register_tool(self.registry.get_tool_schema("analyze_stock"))
+
+        assert self.registry._cached_validation.cache_info().currsize == 0